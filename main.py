@@ -6,7 +6,8 @@ A production-grade parser for NEM12 format meter data files that generates
 SQL INSERT statements for the meter_readings table.
 
 Usage:
-    python main.py <input_file> [--output <output_file>] [--batch-size <size>]
+    python main.py <input_file> [--output <output_file>] [--batch-size <size>] [--workers <n>]
+                   [--format {insert,copy}]
 
 Example:
     python main.py sample_data.csv --output meter_readings.sql --batch-size 1000
@@ -15,17 +16,91 @@ Example:
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import TextIO
 
-from nem12 import NEM12Parser, SQLGenerator
+from nem12 import COPYGenerator, NEM12Parser, SQLGenerator
+
+# Output is written in blocks of about 1 MiB so each write() of a batch
+# is not a syscall of its own
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Most buffers a single writev() call accepts on Linux and macOS
+_IOV_MAX = 1024
+
+
+class _GatherWriter:
+    """
+    Write output as a gather list of buffers with os.writev().
+    
+    Buffers are collected until about OUTPUT_BUFFER_SIZE bytes are pending
+    and then written with a single syscall, without first being copied
+    into one contiguous buffer.
+    """
+    
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+        self._buffers: list[bytes | memoryview] = []
+        self._pending = 0
+    
+    def write(self, data: bytes) -> None:
+        """Queue a buffer, writing out the queue once it is large enough."""
+        self._buffers.append(data)
+        self._pending += len(data)
+        if self._pending >= OUTPUT_BUFFER_SIZE or len(self._buffers) >= _IOV_MAX:
+            self.flush()
+    
+    def flush(self) -> None:
+        """
+        Write all queued buffers, resuming after partial writes.
+        
+        The queue is cleared even if a write fails, so a later flush does
+        not retry the same buffers and raise again.
+        """
+        buffers = self._buffers
+        self._buffers = []
+        self._pending = 0
+        start = 0
+        
+        while start < len(buffers):
+            written = os.writev(self._fd, buffers[start:start + _IOV_MAX])
+            # Skip the buffers written in full and trim a partially written one
+            while start < len(buffers) and written >= len(buffers[start]):
+                written -= len(buffers[start])
+                start += 1
+            if written:
+                buffers[start] = memoryview(buffers[start])[written:]
+
+
+class _TextWriter:
+    """
+    Write encoded output to a text stream.
+    
+    Used when sys.stdout has been replaced by an object without a binary
+    buffer, such as the StringIO installed by contextlib.redirect_stdout.
+    """
+    
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+    
+    def write(self, data: bytes) -> None:
+        """Decode the data and write it to the text stream."""
+        self._stream.write(data.decode("utf-8"))
+    
+    def flush(self) -> None:
+        """Flush the text stream."""
+        self._stream.flush()
 
 
 def process_file(
     input_path: Path,
     output_path: Path | None = None,
-    batch_size: int = 1000
+    batch_size: int = 1000,
+    workers: int = 1,
+    output_format: str = "insert"
 ) -> int:
     """
     Process a NEM12 file and generate SQL INSERT statements.
@@ -34,44 +109,64 @@ def process_file(
         input_path: Path to the input NEM12 CSV file
         output_path: Optional path to output SQL file. If None, writes to stdout.
         batch_size: Number of rows per INSERT statement
+        workers: Number of processes to parse with (1 parses in-process)
+        output_format: "insert" for INSERT statements, or "copy" for
+                      PostgreSQL COPY ... FROM STDIN blocks
         
     Returns:
         Total number of readings processed
     """
     parser = NEM12Parser()
-    generator = SQLGenerator(batch_size=batch_size)
-    
-    readings = parser.parse(input_path)
-    statements = generator.generate(readings)
+    if output_format == "copy":
+        generator = COPYGenerator(batch_size=batch_size)
+    else:
+        generator = SQLGenerator(batch_size=batch_size)
     
-    total_readings = 0
+    if workers > 1:
+        batches = parser.parse_parallel(input_path, workers=workers)
+    else:
+        batches = parser.parse_batches(input_path)
+    statements = generator.generate_batches(batches)
     
     # Determine output destination
-    if output_path:
-        output_file = open(output_path, "w", encoding="utf-8")
+    if not output_path:
+        output_file = getattr(sys.stdout, "buffer", None)
+        if output_file is None:
+            writer = _TextWriter(sys.stdout)
+        else:
+            sys.stdout.flush()
+            writer = output_file
+    elif hasattr(os, "writev"):
+        output_file = open(output_path, "wb", buffering=0)
+        writer = _GatherWriter(output_file.fileno())
     else:
-        output_file = sys.stdout
+        output_file = open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE)
+        writer = output_file
     
     try:
         # Write header comment
         header = f"-- Generated from: {input_path.name}\n"
         header += f"-- Generated at: {datetime.now().isoformat()}\n"
         header += f"-- Batch size: {batch_size}\n\n"
-        output_file.write(header)
+        writer.write(header.encode("utf-8"))
         
         for statement in statements:
-            output_file.write(statement)
-            output_file.write("\n\n")
-            # Count rows in this statement (count value tuples)
-            total_readings += statement.count("('")
+            writer.write(statement.encode("utf-8"))
+            writer.write(b"\n\n")
+        
+        total_readings = generator.rows_emitted
         
         # Write footer
         footer = f"-- Total readings: {total_readings}\n"
-        output_file.write(footer)
+        writer.write(footer.encode("utf-8"))
         
     finally:
-        if output_path:
-            output_file.close()
+        try:
+            writer.flush()
+        finally:
+            # Close the file even if the final write failed
+            if output_path:
+                output_file.close()
     
     return total_readings
 
@@ -91,6 +186,12 @@ Examples:
     
     # Custom batch size for very large files
     python main.py large_file.csv --output output.sql --batch-size 5000
+    
+    # Parse a very large file with 8 processes
+    python main.py large_file.csv --output output.sql --workers 8
+    
+    # Emit PostgreSQL COPY blocks for faster bulk loading
+    python main.py large_file.csv --output output.sql --format copy
         """
     )
     
@@ -114,6 +215,21 @@ Examples:
         help="Number of rows per INSERT statement (default: 1000)"
     )
     
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to parse the input (default: 1)"
+    )
+    
+    parser.add_argument(
+        "-f", "--format",
+        choices=("insert", "copy"),
+        default="insert",
+        dest="output_format",
+        help="Emit INSERT statements or PostgreSQL COPY blocks (default: insert)"
+    )
+    
     args = parser.parse_args()
     
     # Validate input file
@@ -129,7 +245,9 @@ Examples:
         total = process_file(
             input_path=args.input_file,
             output_path=args.output_file,
-            batch_size=args.batch_size
+            batch_size=args.batch_size,
+            workers=args.workers,
+            output_format=args.output_format
         )
         
         # Print summary to stderr (so it doesn't mix with stdout output)
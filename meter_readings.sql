@@ -1,22 +1,22 @@
 -- Generated from: sample_data.csv
--- Generated at: 2026-01-19T10:28:24.310192
+-- Generated at: 2026-10-15T21:27:12.615112
 -- Batch size: 1000
 
 INSERT INTO meter_readings ("nmi", "timestamp", "consumption") VALUES
-('NEM1201009', '2005-03-01 00:30:00', 0),
-('NEM1201009', '2005-03-01 01:00:00', 0),
-('NEM1201009', '2005-03-01 01:30:00', 0),
-('NEM1201009', '2005-03-01 02:00:00', 0),
-('NEM1201009', '2005-03-01 02:30:00', 0),
-('NEM1201009', '2005-03-01 03:00:00', 0),
-('NEM1201009', '2005-03-01 03:30:00', 0),
-('NEM1201009', '2005-03-01 04:00:00', 0),
-('NEM1201009', '2005-03-01 04:30:00', 0),
-('NEM1201009', '2005-03-01 05:00:00', 0),
-('NEM1201009', '2005-03-01 05:30:00', 0),
-('NEM1201009', '2005-03-01 06:00:00', 0),
+('NEM1201009', '2005-03-01 00:30:00', 0.0),
+('NEM1201009', '2005-03-01 01:00:00', 0.0),
+('NEM1201009', '2005-03-01 01:30:00', 0.0),
+('NEM1201009', '2005-03-01 02:00:00', 0.0),
+('NEM1201009', '2005-03-01 02:30:00', 0.0),
+('NEM1201009', '2005-03-01 03:00:00', 0.0),
+('NEM1201009', '2005-03-01 03:30:00', 0.0),
+('NEM1201009', '2005-03-01 04:00:00', 0.0),
+('NEM1201009', '2005-03-01 04:30:00', 0.0),
+('NEM1201009', '2005-03-01 05:00:00', 0.0),
+('NEM1201009', '2005-03-01 05:30:00', 0.0),
+('NEM1201009', '2005-03-01 06:00:00', 0.0),
 ('NEM1201009', '2005-03-01 06:30:00', 0.461),
-('NEM1201009', '2005-03-01 07:00:00', 0.810),
+('NEM1201009', '2005-03-01 07:00:00', 0.81),
 ('NEM1201009', '2005-03-01 07:30:00', 0.568),
 ('NEM1201009', '2005-03-01 08:00:00', 1.234),
 ('NEM1201009', '2005-03-01 08:30:00', 1.353),
@@ -33,12 +33,12 @@ INSERT INTO meter_readings ("nmi", "timestamp", "consumption") VALUES
 ('NEM1201009', '2005-03-01 14:00:00', 0.985),
 ('NEM1201009', '2005-03-01 14:30:00', 0.876),
 ('NEM1201009', '2005-03-01 15:00:00', 0.555),
-('NEM1201009', '2005-03-01 15:30:00', 0.760),
+('NEM1201009', '2005-03-01 15:30:00', 0.76),
 ('NEM1201009', '2005-03-01 16:00:00', 0.938),
 ('NEM1201009', '2005-03-01 16:30:00', 0.566),
 ('NEM1201009', '2005-03-01 17:00:00', 0.512),
-('NEM1201009', '2005-03-01 17:30:00', 0.970),
-('NEM1201009', '2005-03-01 18:00:00', 0.760),
+('NEM1201009', '2005-03-01 17:30:00', 0.97),
+('NEM1201009', '2005-03-01 18:00:00', 0.76),
 ('NEM1201009', '2005-03-01 18:30:00', 0.731),
 ('NEM1201009', '2005-03-01 19:00:00', 0.615),
 ('NEM1201009', '2005-03-01 19:30:00', 0.886),
@@ -46,26 +46,26 @@ INSERT INTO meter_readings ("nmi", "timestamp", "consumption") VALUES
 ('NEM1201009', '2005-03-01 20:30:00', 0.774),
 ('NEM1201009', '2005-03-01 21:00:00', 0.712),
 ('NEM1201009', '2005-03-01 21:30:00', 0.598),
-('NEM1201009', '2005-03-01 22:00:00', 0.670),
+('NEM1201009', '2005-03-01 22:00:00', 0.67),
 ('NEM1201009', '2005-03-01 22:30:00', 0.587),
 ('NEM1201009', '2005-03-01 23:00:00', 0.657),
 ('NEM1201009', '2005-03-01 23:30:00', 0.345),
 ('NEM1201009', '2005-03-02 00:00:00', 0.231),
-('NEM1201009', '2005-03-02 00:30:00', 0),
-('NEM1201009', '2005-03-02 01:00:00', 0),
-('NEM1201009', '2005-03-02 01:30:00', 0),
-('NEM1201009', '2005-03-02 02:00:00', 0),
-('NEM1201009', '2005-03-02 02:30:00', 0),
-('NEM1201009', '2005-03-02 03:00:00', 0),
-('NEM1201009', '2005-03-02 03:30:00', 0),
-('NEM1201009', '2005-03-02 04:00:00', 0),
-('NEM1201009', '2005-03-02 04:30:00', 0),
-('NEM1201009', '2005-03-02 05:00:00', 0),
-('NEM1201009', '2005-03-02 05:30:00', 0),
-('NEM1201009', '2005-03-02 06:00:00', 0),
+('NEM1201009', '2005-03-02 00:30:00', 0.0),
+('NEM1201009', '2005-03-02 01:00:00', 0.0),
+('NEM1201009', '2005-03-02 01:30:00', 0.0),
+('NEM1201009', '2005-03-02 02:00:00', 0.0),
+('NEM1201009', '2005-03-02 02:30:00', 0.0),
+('NEM1201009', '2005-03-02 03:00:00', 0.0),
+('NEM1201009', '2005-03-02 03:30:00', 0.0),
+('NEM1201009', '2005-03-02 04:00:00', 0.0),
+('NEM1201009', '2005-03-02 04:30:00', 0.0),
+('NEM1201009', '2005-03-02 05:00:00', 0.0),
+('NEM1201009', '2005-03-02 05:30:00', 0.0),
+('NEM1201009', '2005-03-02 06:00:00', 0.0),
 ('NEM1201009', '2005-03-02 06:30:00', 0.235),
 ('NEM1201009', '2005-03-02 07:00:00', 0.567),
-('NEM1201009', '2005-03-02 07:30:00', 0.890),
+('NEM1201009', '2005-03-02 07:30:00', 0.89),
 ('NEM1201009', '2005-03-02 08:00:00', 1.123),
 ('NEM1201009', '2005-03-02 08:30:00', 1.345),
 ('NEM1201009', '2005-03-02 09:00:00', 1.567),
@@ -99,69 +99,69 @@ INSERT INTO meter_readings ("nmi", "timestamp", "consumption") VALUES
 ('NEM1201009', '2005-03-02 23:00:00', 0.599),
 ('NEM1201009', '2005-03-02 23:30:00', 0.432),
 ('NEM1201009', '2005-03-03 00:00:00', 0.432),
-('NEM1201009', '2005-03-03 00:30:00', 0),
-('NEM1201009', '2005-03-03 01:00:00', 0),
-('NEM1201009', '2005-03-03 01:30:00', 0),
-('NEM1201009', '2005-03-03 02:00:00', 0),
-('NEM1201009', '2005-03-03 02:30:00', 0),
-('NEM1201009', '2005-03-03 03:00:00', 0),
-('NEM1201009', '2005-03-03 03:30:00', 0),
-('NEM1201009', '2005-03-03 04:00:00', 0),
-('NEM1201009', '2005-03-03 04:30:00', 0),
-('NEM1201009', '2005-03-03 05:00:00', 0),
-('NEM1201009', '2005-03-03 05:30:00', 0),
-('NEM1201009', '2005-03-03 06:00:00', 0),
+('NEM1201009', '2005-03-03 00:30:00', 0.0),
+('NEM1201009', '2005-03-03 01:00:00', 0.0),
+('NEM1201009', '2005-03-03 01:30:00', 0.0),
+('NEM1201009', '2005-03-03 02:00:00', 0.0),
+('NEM1201009', '2005-03-03 02:30:00', 0.0),
+('NEM1201009', '2005-03-03 03:00:00', 0.0),
+('NEM1201009', '2005-03-03 03:30:00', 0.0),
+('NEM1201009', '2005-03-03 04:00:00', 0.0),
+('NEM1201009', '2005-03-03 04:30:00', 0.0),
+('NEM1201009', '2005-03-03 05:00:00', 0.0),
+('NEM1201009', '2005-03-03 05:30:00', 0.0),
+('NEM1201009', '2005-03-03 06:00:00', 0.0),
 ('NEM1201009', '2005-03-03 06:30:00', 0.261),
-('NEM1201009', '2005-03-03 07:00:00', 0.310),
+('NEM1201009', '2005-03-03 07:00:00', 0.31),
 ('NEM1201009', '2005-03-03 07:30:00', 0.678),
 ('NEM1201009', '2005-03-03 08:00:00', 0.934),
 ('NEM1201009', '2005-03-03 08:30:00', 1.211),
 ('NEM1201009', '2005-03-03 09:00:00', 1.134),
 ('NEM1201009', '2005-03-03 09:30:00', 1.423),
-('NEM1201009', '2005-03-03 10:00:00', 1.370),
+('NEM1201009', '2005-03-03 10:00:00', 1.37),
 ('NEM1201009', '2005-03-03 10:30:00', 0.988),
 ('NEM1201009', '2005-03-03 11:00:00', 1.207),
-('NEM1201009', '2005-03-03 11:30:00', 0.890),
-('NEM1201009', '2005-03-03 12:00:00', 1.320),
-('NEM1201009', '2005-03-03 12:30:00', 1.130),
+('NEM1201009', '2005-03-03 11:30:00', 0.89),
+('NEM1201009', '2005-03-03 12:00:00', 1.32),
+('NEM1201009', '2005-03-03 12:30:00', 1.13),
 ('NEM1201009', '2005-03-03 13:00:00', 1.913),
-('NEM1201009', '2005-03-03 13:30:00', 1.180),
-('NEM1201009', '2005-03-03 14:00:00', 0.950),
+('NEM1201009', '2005-03-03 13:30:00', 1.18),
+('NEM1201009', '2005-03-03 14:00:00', 0.95),
 ('NEM1201009', '2005-03-03 14:30:00', 0.746),
 ('NEM1201009', '2005-03-03 15:00:00', 0.635),
 ('NEM1201009', '2005-03-03 15:30:00', 0.956),
 ('NEM1201009', '2005-03-03 16:00:00', 0.887),
-('NEM1201009', '2005-03-03 16:30:00', 0.560),
-('NEM1201009', '2005-03-03 17:00:00', 0.700),
+('NEM1201009', '2005-03-03 16:30:00', 0.56),
+('NEM1201009', '2005-03-03 17:00:00', 0.7),
 ('NEM1201009', '2005-03-03 17:30:00', 0.788),
 ('NEM1201009', '2005-03-03 18:00:00', 0.668),
 ('NEM1201009', '2005-03-03 18:30:00', 0.543),
 ('NEM1201009', '2005-03-03 19:00:00', 0.738),
 ('NEM1201009', '2005-03-03 19:30:00', 0.802),
-('NEM1201009', '2005-03-03 20:00:00', 0.490),
+('NEM1201009', '2005-03-03 20:00:00', 0.49),
 ('NEM1201009', '2005-03-03 20:30:00', 0.598),
 ('NEM1201009', '2005-03-03 21:00:00', 0.809),
-('NEM1201009', '2005-03-03 21:30:00', 0.520),
-('NEM1201009', '2005-03-03 22:00:00', 0.670),
-('NEM1201009', '2005-03-03 22:30:00', 0.570),
-('NEM1201009', '2005-03-03 23:00:00', 0.600),
+('NEM1201009', '2005-03-03 21:30:00', 0.52),
+('NEM1201009', '2005-03-03 22:00:00', 0.67),
+('NEM1201009', '2005-03-03 22:30:00', 0.57),
+('NEM1201009', '2005-03-03 23:00:00', 0.6),
 ('NEM1201009', '2005-03-03 23:30:00', 0.289),
 ('NEM1201009', '2005-03-04 00:00:00', 0.321),
-('NEM1201009', '2005-03-04 00:30:00', 0),
-('NEM1201009', '2005-03-04 01:00:00', 0),
-('NEM1201009', '2005-03-04 01:30:00', 0),
-('NEM1201009', '2005-03-04 02:00:00', 0),
-('NEM1201009', '2005-03-04 02:30:00', 0),
-('NEM1201009', '2005-03-04 03:00:00', 0),
-('NEM1201009', '2005-03-04 03:30:00', 0),
-('NEM1201009', '2005-03-04 04:00:00', 0),
-('NEM1201009', '2005-03-04 04:30:00', 0),
-('NEM1201009', '2005-03-04 05:00:00', 0),
-('NEM1201009', '2005-03-04 05:30:00', 0),
-('NEM1201009', '2005-03-04 06:00:00', 0),
+('NEM1201009', '2005-03-04 00:30:00', 0.0),
+('NEM1201009', '2005-03-04 01:00:00', 0.0),
+('NEM1201009', '2005-03-04 01:30:00', 0.0),
+('NEM1201009', '2005-03-04 02:00:00', 0.0),
+('NEM1201009', '2005-03-04 02:30:00', 0.0),
+('NEM1201009', '2005-03-04 03:00:00', 0.0),
+('NEM1201009', '2005-03-04 03:30:00', 0.0),
+('NEM1201009', '2005-03-04 04:00:00', 0.0),
+('NEM1201009', '2005-03-04 04:30:00', 0.0),
+('NEM1201009', '2005-03-04 05:00:00', 0.0),
+('NEM1201009', '2005-03-04 05:30:00', 0.0),
+('NEM1201009', '2005-03-04 06:00:00', 0.0),
 ('NEM1201009', '2005-03-04 06:30:00', 0.335),
 ('NEM1201009', '2005-03-04 07:00:00', 0.667),
-('NEM1201009', '2005-03-04 07:30:00', 0.790),
+('NEM1201009', '2005-03-04 07:30:00', 0.79),
 ('NEM1201009', '2005-03-04 08:00:00', 1.023),
 ('NEM1201009', '2005-03-04 08:30:00', 1.145),
 ('NEM1201009', '2005-03-04 09:00:00', 1.777),
@@ -195,35 +195,35 @@ INSERT INTO meter_readings ("nmi", "timestamp", "consumption") VALUES
 ('NEM1201009', '2005-03-04 23:00:00', 0.799),
 ('NEM1201009', '2005-03-04 23:30:00', 0.232),
 ('NEM1201009', '2005-03-05 00:00:00', 0.612),
-('NEM1201010', '2005-03-01 00:30:00', 0),
-('NEM1201010', '2005-03-01 01:00:00', 0),
-('NEM1201010', '2005-03-01 01:30:00', 0),
-('NEM1201010', '2005-03-01 02:00:00', 0),
-('NEM1201010', '2005-03-01 02:30:00', 0),
-('NEM1201010', '2005-03-01 03:00:00', 0),
-('NEM1201010', '2005-03-01 03:30:00', 0),
-('NEM1201010', '2005-03-01 04:00:00', 0),
-('NEM1201010', '2005-03-01 04:30:00', 0),
-('NEM1201010', '2005-03-01 05:00:00', 0),
-('NEM1201010', '2005-03-01 05:30:00', 0),
-('NEM1201010', '2005-03-01 06:00:00', 0),
+('NEM1201010', '2005-03-01 00:30:00', 0.0),
+('NEM1201010', '2005-03-01 01:00:00', 0.0),
+('NEM1201010', '2005-03-01 01:30:00', 0.0),
+('NEM1201010', '2005-03-01 02:00:00', 0.0),
+('NEM1201010', '2005-03-01 02:30:00', 0.0),
+('NEM1201010', '2005-03-01 03:00:00', 0.0),
+('NEM1201010', '2005-03-01 03:30:00', 0.0),
+('NEM1201010', '2005-03-01 04:00:00', 0.0),
+('NEM1201010', '2005-03-01 04:30:00', 0.0),
+('NEM1201010', '2005-03-01 05:00:00', 0.0),
+('NEM1201010', '2005-03-01 05:30:00', 0.0),
+('NEM1201010', '2005-03-01 06:00:00', 0.0),
 ('NEM1201010', '2005-03-01 06:30:00', 0.154),
-('NEM1201010', '2005-03-01 07:00:00', 0.460),
-('NEM1201010', '2005-03-01 07:30:00', 0.770),
+('NEM1201010', '2005-03-01 07:00:00', 0.46),
+('NEM1201010', '2005-03-01 07:30:00', 0.77),
 ('NEM1201010', '2005-03-01 08:00:00', 1.003),
 ('NEM1201010', '2005-03-01 08:30:00', 1.059),
-('NEM1201010', '2005-03-01 09:00:00', 1.750),
+('NEM1201010', '2005-03-01 09:00:00', 1.75),
 ('NEM1201010', '2005-03-01 09:30:00', 1.423),
-('NEM1201010', '2005-03-01 10:00:00', 1.200),
-('NEM1201010', '2005-03-01 10:30:00', 0.980),
+('NEM1201010', '2005-03-01 10:00:00', 1.2),
+('NEM1201010', '2005-03-01 10:30:00', 0.98),
 ('NEM1201010', '2005-03-01 11:00:00', 1.111),
-('NEM1201010', '2005-03-01 11:30:00', 0.800),
+('NEM1201010', '2005-03-01 11:30:00', 0.8),
 ('NEM1201010', '2005-03-01 12:00:00', 1.403),
 ('NEM1201010', '2005-03-01 12:30:00', 1.145),
 ('NEM1201010', '2005-03-01 13:00:00', 1.173),
 ('NEM1201010', '2005-03-01 13:30:00', 1.065),
 ('NEM1201010', '2005-03-01 14:00:00', 1.187),
-('NEM1201010', '2005-03-01 14:30:00', 0.900),
+('NEM1201010', '2005-03-01 14:30:00', 0.9),
 ('NEM1201010', '2005-03-01 15:00:00', 0.998),
 ('NEM1201010', '2005-03-01 15:30:00', 0.768),
 ('NEM1201010', '2005-03-01 16:00:00', 1.432),
@@ -234,51 +234,51 @@ INSERT INTO meter_readings ("nmi", "timestamp", "consumption") VALUES
 ('NEM1201010', '2005-03-01 18:30:00', 1.504),
 ('NEM1201010', '2005-03-01 19:00:00', 0.719),
 ('NEM1201010', '2005-03-01 19:30:00', 0.817),
-('NEM1201010', '2005-03-01 20:00:00', 0.780),
+('NEM1201010', '2005-03-01 20:00:00', 0.78),
 ('NEM1201010', '2005-03-01 20:30:00', 0.709),
-('NEM1201010', '2005-03-01 21:00:00', 0.700),
+('NEM1201010', '2005-03-01 21:00:00', 0.7),
 ('NEM1201010', '2005-03-01 21:30:00', 0.565),
 ('NEM1201010', '2005-03-01 22:00:00', 0.655),
 ('NEM1201010', '2005-03-01 22:30:00', 0.543),
 ('NEM1201010', '2005-03-01 23:00:00', 0.786),
-('NEM1201010', '2005-03-01 23:30:00', 0.430),
+('NEM1201010', '2005-03-01 23:30:00', 0.43),
 ('NEM1201010', '2005-03-02 00:00:00', 0.432),
-('NEM1201010', '2005-03-02 00:30:00', 0),
-('NEM1201010', '2005-03-02 01:00:00', 0),
-('NEM1201010', '2005-03-02 01:30:00', 0),
-('NEM1201010', '2005-03-02 02:00:00', 0),
-('NEM1201010', '2005-03-02 02:30:00', 0),
-('NEM1201010', '2005-03-02 03:00:00', 0),
-('NEM1201010', '2005-03-02 03:30:00', 0),
-('NEM1201010', '2005-03-02 04:00:00', 0),
-('NEM1201010', '2005-03-02 04:30:00', 0),
-('NEM1201010', '2005-03-02 05:00:00', 0),
-('NEM1201010', '2005-03-02 05:30:00', 0),
-('NEM1201010', '2005-03-02 06:00:00', 0),
+('NEM1201010', '2005-03-02 00:30:00', 0.0),
+('NEM1201010', '2005-03-02 01:00:00', 0.0),
+('NEM1201010', '2005-03-02 01:30:00', 0.0),
+('NEM1201010', '2005-03-02 02:00:00', 0.0),
+('NEM1201010', '2005-03-02 02:30:00', 0.0),
+('NEM1201010', '2005-03-02 03:00:00', 0.0),
+('NEM1201010', '2005-03-02 03:30:00', 0.0),
+('NEM1201010', '2005-03-02 04:00:00', 0.0),
+('NEM1201010', '2005-03-02 04:30:00', 0.0),
+('NEM1201010', '2005-03-02 05:00:00', 0.0),
+('NEM1201010', '2005-03-02 05:30:00', 0.0),
+('NEM1201010', '2005-03-02 06:00:00', 0.0),
 ('NEM1201010', '2005-03-02 06:30:00', 0.461),
-('NEM1201010', '2005-03-02 07:00:00', 0.810),
+('NEM1201010', '2005-03-02 07:00:00', 0.81),
 ('NEM1201010', '2005-03-02 07:30:00', 0.776),
 ('NEM1201010', '2005-03-02 08:00:00', 1.004),
 ('NEM1201010', '2005-03-02 08:30:00', 1.034),
-('NEM1201010', '2005-03-02 09:00:00', 1.200),
-('NEM1201010', '2005-03-02 09:30:00', 1.310),
+('NEM1201010', '2005-03-02 09:00:00', 1.2),
+('NEM1201010', '2005-03-02 09:30:00', 1.31),
 ('NEM1201010', '2005-03-02 10:00:00', 1.342),
 ('NEM1201010', '2005-03-02 10:30:00', 0.998),
 ('NEM1201010', '2005-03-02 11:00:00', 1.311),
 ('NEM1201010', '2005-03-02 11:30:00', 1.095),
-('NEM1201010', '2005-03-02 12:00:00', 1.320),
+('NEM1201010', '2005-03-02 12:00:00', 1.32),
 ('NEM1201010', '2005-03-02 12:30:00', 1.115),
 ('NEM1201010', '2005-03-02 13:00:00', 1.436),
-('NEM1201010', '2005-03-02 13:30:00', 0.890),
+('NEM1201010', '2005-03-02 13:30:00', 0.89),
 ('NEM1201010', '2005-03-02 14:00:00', 1.255),
 ('NEM1201010', '2005-03-02 14:30:00', 0.916),
 ('NEM1201010', '2005-03-02 15:00:00', 0.955),
 ('NEM1201010', '2005-03-02 15:30:00', 0.711),
-('NEM1201010', '2005-03-02 16:00:00', 0.780),
+('NEM1201010', '2005-03-02 16:00:00', 0.78),
 ('NEM1201010', '2005-03-02 16:30:00', 0.606),
-('NEM1201010', '2005-03-02 17:00:00', 0.510),
+('NEM1201010', '2005-03-02 17:00:00', 0.51),
 ('NEM1201010', '2005-03-02 17:30:00', 0.905),
-('NEM1201010', '2005-03-02 18:00:00', 0.660),
+('NEM1201010', '2005-03-02 18:00:00', 0.66),
 ('NEM1201010', '2005-03-02 18:30:00', 0.835),
 ('NEM1201010', '2005-03-02 19:00:00', 0.798),
 ('NEM1201010', '2005-03-02 19:30:00', 0.965),
@@ -286,26 +286,26 @@ INSERT INTO meter_readings ("nmi", "timestamp", "consumption") VALUES
 ('NEM1201010', '2005-03-02 20:30:00', 1.004),
 ('NEM1201010', '2005-03-02 21:00:00', 0.772),
 ('NEM1201010', '2005-03-02 21:30:00', 0.508),
-('NEM1201010', '2005-03-02 22:00:00', 0.670),
-('NEM1201010', '2005-03-02 22:30:00', 0.670),
+('NEM1201010', '2005-03-02 22:00:00', 0.67),
+('NEM1201010', '2005-03-02 22:30:00', 0.67),
 ('NEM1201010', '2005-03-02 23:00:00', 0.432),
 ('NEM1201010', '2005-03-02 23:30:00', 0.415),
-('NEM1201010', '2005-03-03 00:00:00', 0.220),
-('NEM1201010', '2005-03-03 00:30:00', 0),
-('NEM1201010', '2005-03-03 01:00:00', 0),
-('NEM1201010', '2005-03-03 01:30:00', 0),
-('NEM1201010', '2005-03-03 02:00:00', 0),
-('NEM1201010', '2005-03-03 02:30:00', 0),
-('NEM1201010', '2005-03-03 03:00:00', 0),
-('NEM1201010', '2005-03-03 03:30:00', 0),
-('NEM1201010', '2005-03-03 04:00:00', 0),
-('NEM1201010', '2005-03-03 04:30:00', 0),
-('NEM1201010', '2005-03-03 05:00:00', 0),
-('NEM1201010', '2005-03-03 05:30:00', 0),
-('NEM1201010', '2005-03-03 06:00:00', 0),
+('NEM1201010', '2005-03-03 00:00:00', 0.22),
+('NEM1201010', '2005-03-03 00:30:00', 0.0),
+('NEM1201010', '2005-03-03 01:00:00', 0.0),
+('NEM1201010', '2005-03-03 01:30:00', 0.0),
+('NEM1201010', '2005-03-03 02:00:00', 0.0),
+('NEM1201010', '2005-03-03 02:30:00', 0.0),
+('NEM1201010', '2005-03-03 03:00:00', 0.0),
+('NEM1201010', '2005-03-03 03:30:00', 0.0),
+('NEM1201010', '2005-03-03 04:00:00', 0.0),
+('NEM1201010', '2005-03-03 04:30:00', 0.0),
+('NEM1201010', '2005-03-03 05:00:00', 0.0),
+('NEM1201010', '2005-03-03 05:30:00', 0.0),
+('NEM1201010', '2005-03-03 06:00:00', 0.0),
 ('NEM1201010', '2005-03-03 06:30:00', 0.335),
 ('NEM1201010', '2005-03-03 07:00:00', 0.667),
-('NEM1201010', '2005-03-03 07:30:00', 0.790),
+('NEM1201010', '2005-03-03 07:30:00', 0.79),
 ('NEM1201010', '2005-03-03 08:00:00', 1.023),
 ('NEM1201010', '2005-03-03 08:30:00', 1.145),
 ('NEM1201010', '2005-03-03 09:00:00', 1.777),
@@ -338,26 +338,26 @@ INSERT INTO meter_readings ("nmi", "timestamp", "consumption") VALUES
 ('NEM1201010', '2005-03-03 22:30:00', 0.674),
 ('NEM1201010', '2005-03-03 23:00:00', 0.799),
 ('NEM1201010', '2005-03-03 23:30:00', 0.232),
-('NEM1201010', '2005-03-04 00:00:00', 0.610),
-('NEM1201010', '2005-03-04 00:30:00', 0),
-('NEM1201010', '2005-03-04 01:00:00', 0),
-('NEM1201010', '2005-03-04 01:30:00', 0),
-('NEM1201010', '2005-03-04 02:00:00', 0),
-('NEM1201010', '2005-03-04 02:30:00', 0),
-('NEM1201010', '2005-03-04 03:00:00', 0),
-('NEM1201010', '2005-03-04 03:30:00', 0),
-('NEM1201010', '2005-03-04 04:00:00', 0),
-('NEM1201010', '2005-03-04 04:30:00', 0),
-('NEM1201010', '2005-03-04 05:00:00', 0),
-('NEM1201010', '2005-03-04 05:30:00', 0),
-('NEM1201010', '2005-03-04 06:00:00', 0),
+('NEM1201010', '2005-03-04 00:00:00', 0.61),
+('NEM1201010', '2005-03-04 00:30:00', 0.0),
+('NEM1201010', '2005-03-04 01:00:00', 0.0),
+('NEM1201010', '2005-03-04 01:30:00', 0.0),
+('NEM1201010', '2005-03-04 02:00:00', 0.0),
+('NEM1201010', '2005-03-04 02:30:00', 0.0),
+('NEM1201010', '2005-03-04 03:00:00', 0.0),
+('NEM1201010', '2005-03-04 03:30:00', 0.0),
+('NEM1201010', '2005-03-04 04:00:00', 0.0),
+('NEM1201010', '2005-03-04 04:30:00', 0.0),
+('NEM1201010', '2005-03-04 05:00:00', 0.0),
+('NEM1201010', '2005-03-04 05:30:00', 0.0),
+('NEM1201010', '2005-03-04 06:00:00', 0.0),
 ('NEM1201010', '2005-03-04 06:30:00', 0.461),
 ('NEM1201010', '2005-03-04 07:00:00', 0.415),
 ('NEM1201010', '2005-03-04 07:30:00', 0.778),
-('NEM1201010', '2005-03-04 08:00:00', 0.940),
+('NEM1201010', '2005-03-04 08:00:00', 0.94),
 ('NEM1201010', '2005-03-04 08:30:00', 1.191),
 ('NEM1201010', '2005-03-04 09:00:00', 1.345),
-('NEM1201010', '2005-03-04 09:30:00', 1.390),
+('NEM1201010', '2005-03-04 09:30:00', 1.39),
 ('NEM1201010', '2005-03-04 10:00:00', 1.222),
 ('NEM1201010', '2005-03-04 10:30:00', 1.134),
 ('NEM1201010', '2005-03-04 11:00:00', 1.207),
@@ -365,27 +365,27 @@ INSERT INTO meter_readings ("nmi", "timestamp", "consumption") VALUES
 ('NEM1201010', '2005-03-04 12:00:00', 1.655),
 ('NEM1201010', '2005-03-04 12:30:00', 1.099),
 ('NEM1201010', '2005-03-04 13:00:00', 1.625),
-('NEM1201010', '2005-03-04 13:30:00', 1.010),
-('NEM1201010', '2005-03-04 14:00:00', 0.950),
+('NEM1201010', '2005-03-04 13:30:00', 1.01),
+('NEM1201010', '2005-03-04 14:00:00', 0.95),
 ('NEM1201010', '2005-03-04 14:30:00', 1.255),
 ('NEM1201010', '2005-03-04 15:00:00', 0.635),
 ('NEM1201010', '2005-03-04 15:30:00', 0.956),
-('NEM1201010', '2005-03-04 16:00:00', 0.880),
-('NEM1201010', '2005-03-04 16:30:00', 0.660),
-('NEM1201010', '2005-03-04 17:00:00', 0.810),
+('NEM1201010', '2005-03-04 16:00:00', 0.88),
+('NEM1201010', '2005-03-04 16:30:00', 0.66),
+('NEM1201010', '2005-03-04 17:00:00', 0.81),
 ('NEM1201010', '2005-03-04 17:30:00', 0.878),
 ('NEM1201010', '2005-03-04 18:00:00', 0.778),
 ('NEM1201010', '2005-03-04 18:30:00', 0.643),
 ('NEM1201010', '2005-03-04 19:00:00', 0.838),
 ('NEM1201010', '2005-03-04 19:30:00', 0.812),
-('NEM1201010', '2005-03-04 20:00:00', 0.490),
+('NEM1201010', '2005-03-04 20:00:00', 0.49),
 ('NEM1201010', '2005-03-04 20:30:00', 0.598),
 ('NEM1201010', '2005-03-04 21:00:00', 0.811),
 ('NEM1201010', '2005-03-04 21:30:00', 0.572),
 ('NEM1201010', '2005-03-04 22:00:00', 0.417),
 ('NEM1201010', '2005-03-04 22:30:00', 0.707),
-('NEM1201010', '2005-03-04 23:00:00', 0.670),
-('NEM1201010', '2005-03-04 23:30:00', 0.290),
+('NEM1201010', '2005-03-04 23:00:00', 0.67),
+('NEM1201010', '2005-03-04 23:30:00', 0.29),
 ('NEM1201010', '2005-03-05 00:00:00', 0.355);
 
 -- Total readings: 384
@@ -5,12 +5,15 @@ A production-grade parser for NEM12 format meter data files that generates
 SQL INSERT statements for the meter_readings table.
 """
 
+from .interval_batch import IntervalBatch
 from .meter_reading import MeterReading
 from .nmi_context import NMIContext
 from .parser import NEM12Parser
-from .sql_generator import SQLGenerator
+from .sql_generator import COPYGenerator, SQLGenerator
 
 __all__ = [
+    "COPYGenerator",
+    "IntervalBatch",
     "MeterReading",
     "NMIContext",
     "NEM12Parser",
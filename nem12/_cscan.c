@@ -0,0 +1,232 @@
+/*
+ * Optional compiled scanner for NEM12 300 records.
+ *
+ * NEM12Parser uses scan_record() when this module can be imported and
+ * splits and converts records in Python otherwise. Build it in place with:
+ *
+ *     python setup.py build_ext --inplace
+ *
+ * The scanner only handles records whose values are all plain non-negative
+ * numbers. For any other record it returns None, and the parser handles the
+ * record in Python so that warnings and errors are reported the same way.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <limits.h>
+#include <string.h>
+
+/* Longest value field converted here; longer ones go to the Python path */
+#define MAX_FIELD_LENGTH 63
+
+/* array.array, used to return values in the same typed arrays as Python */
+static PyObject *array_type = NULL;
+
+/*
+ * Characters that can appear in a value accepted without the Python path.
+ * Matches _RECORD_CHARS_RE in _fastparse.py (the comma is the separator).
+ */
+static int
+is_value_char(char c)
+{
+    return (c >= '0' && c <= '9') || c == '.' || c == 'e' || c == 'E'
+        || c == '+' || c == ' ' || c == '\t';
+}
+
+/*
+ * Convert one stripped, non-empty value field.
+ *
+ * Returns 0 and stores the value on success, or -1 if the field must be
+ * checked in Python: it has an invalid character, is not a number float()
+ * accepts, or overflows to infinity.
+ */
+static int
+convert_value(const char *start, const char *end, double *value)
+{
+    char field[MAX_FIELD_LENGTH + 1];
+    Py_ssize_t length = end - start;
+    Py_ssize_t i;
+
+    if (length > MAX_FIELD_LENGTH) {
+        return -1;
+    }
+    for (i = 0; i < length; i++) {
+        if (!is_value_char(start[i])) {
+            return -1;
+        }
+    }
+
+    /* PyOS_string_to_double() is what float() uses once it has stripped
+       the string, so values round identically on both paths */
+    memcpy(field, start, length);
+    field[length] = '\0';
+    *value = PyOS_string_to_double(field, NULL, NULL);
+    if (*value == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return -1;
+    }
+    return Py_IS_INFINITY(*value) ? -1 : 0;
+}
+
+/*
+ * Build an array.array of the given typecode from a block of raw items.
+ */
+static PyObject *
+make_array(const char *typecode, const void *items, Py_ssize_t size)
+{
+    return PyObject_CallFunction(array_type, "sy#", typecode, (const char *)items, size);
+}
+
+PyDoc_STRVAR(scan_record_doc,
+"scan_record(line, count, /)\n"
+"--\n"
+"\n"
+"Split a 300 record and convert its interval values in one pass.\n"
+"\n"
+"Returns (date_field, intervals, consumptions), where date_field is the\n"
+"raw date field, intervals is None if every one of the first ``count``\n"
+"value fields has a value (otherwise an array('H') of the 1-based interval\n"
+"numbers present), and consumptions is an array('d') of the values.\n"
+"Returns None if the record has fewer than three fields or any value is\n"
+"not a finite non-negative number, in which case the caller should parse\n"
+"the record in Python.");
+
+static PyObject *
+scan_record(PyObject *module, PyObject *args)
+{
+    Py_buffer view;
+    Py_ssize_t count;
+    PyObject *result = NULL;
+    PyObject *date_field = NULL;
+    PyObject *intervals = NULL;
+    PyObject *consumptions = NULL;
+    double *values = NULL;
+    unsigned short *numbers = NULL;
+    const char *line, *end, *date, *date_end, *pos;
+    Py_ssize_t fields = 0;
+    Py_ssize_t present = 0;
+
+    if (!PyArg_ParseTuple(args, "y*n:scan_record", &view, &count)) {
+        return NULL;
+    }
+    if (count < 0 || count > USHRT_MAX) {
+        PyErr_SetString(PyExc_ValueError, "count out of range");
+        goto done;
+    }
+
+    line = view.buf;
+    end = line + view.len;
+
+    /* The date is the second field; a record without a third is invalid */
+    date = memchr(line, ',', view.len);
+    if (date == NULL) {
+        goto fall_back;
+    }
+    date++;
+    date_end = memchr(date, ',', end - date);
+    if (date_end == NULL) {
+        goto fall_back;
+    }
+
+    values = PyMem_Malloc((count + 1) * sizeof(double));
+    numbers = PyMem_Malloc((count + 1) * sizeof(unsigned short));
+    if (values == NULL || numbers == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+
+    /* Value fields end at the next comma, or at the end of the line when
+       the record has no trailing fields */
+    pos = date_end + 1;
+    while (fields < count) {
+        const char *field_end = memchr(pos, ',', end - pos);
+        const char *start = pos;
+        const char *stop;
+
+        if (field_end == NULL) {
+            field_end = end;
+        }
+        stop = field_end;
+        fields++;
+
+        while (start < stop && (*start == ' ' || *start == '\t')) {
+            start++;
+        }
+        while (stop > start && (stop[-1] == ' ' || stop[-1] == '\t')) {
+            stop--;
+        }
+        if (start < stop) {
+            if (convert_value(start, stop, &values[present]) < 0) {
+                goto fall_back;
+            }
+            numbers[present++] = (unsigned short)fields;
+        }
+
+        if (field_end == end) {
+            break;
+        }
+        pos = field_end + 1;
+    }
+
+    date_field = PyBytes_FromStringAndSize(date, date_end - date);
+    if (date_field == NULL) {
+        goto done;
+    }
+    if (present == fields) {
+        intervals = Py_NewRef(Py_None);
+    }
+    else {
+        intervals = make_array("H", numbers, present * sizeof(unsigned short));
+        if (intervals == NULL) {
+            goto done;
+        }
+    }
+    consumptions = make_array("d", values, present * sizeof(double));
+    if (consumptions == NULL) {
+        goto done;
+    }
+    result = PyTuple_Pack(3, date_field, intervals, consumptions);
+    goto done;
+
+fall_back:
+    result = Py_NewRef(Py_None);
+
+done:
+    Py_XDECREF(date_field);
+    Py_XDECREF(intervals);
+    Py_XDECREF(consumptions);
+    PyMem_Free(values);
+    PyMem_Free(numbers);
+    PyBuffer_Release(&view);
+    return result;
+}
+
+static PyMethodDef cscan_methods[] = {
+    {"scan_record", scan_record, METH_VARARGS, scan_record_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef cscan_module = {
+    PyModuleDef_HEAD_INIT,
+    "_cscan",
+    "Optional compiled scanner for NEM12 300 records.",
+    -1,
+    cscan_methods
+};
+
+PyMODINIT_FUNC
+PyInit__cscan(void)
+{
+    PyObject *array_module = PyImport_ImportModule("array");
+
+    if (array_module == NULL) {
+        return NULL;
+    }
+    array_type = PyObject_GetAttrString(array_module, "array");
+    Py_DECREF(array_module);
+    if (array_type == NULL) {
+        return NULL;
+    }
+    return PyModule_Create(&cscan_module);
+}
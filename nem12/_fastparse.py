@@ -0,0 +1,130 @@
+"""Batch conversion helpers for the 300 record hot path."""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from math import inf
+from typing import Sequence
+
+# Interval lengths allowed by the NEM12 specification (288, 96 and 48
+# intervals per day). Tables for these are built when the module loads.
+STANDARD_INTERVAL_MINUTES = (5, 15, 30)
+
+# A non-negative decimal number. Excludes the nan/inf spellings and
+# underscores that float() would also accept.
+VALUE_RE = re.compile(r"\+?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+# Characters that can appear in a run of comma-separated VALUE_RE matches.
+# Matching this is several times cheaper than validating each number, and
+# rules out the common invalid values (letters, signs, placeholders).
+_RECORD_CHARS_RE = re.compile(rb"[0-9.eE+ \t,]*")
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_field: bytes) -> datetime:
+    """
+    Parse a YYYYMMDD date by slicing digits rather than via strptime.
+    
+    The raw field is sliced and converted with int() directly, without
+    decoding it to str first. Results are cached, since every NMI and
+    register in a file normally covers the same dates; the shared
+    datetime objects also make later cache lookups keyed on the date
+    cheaper, as a datetime caches its own hash.
+    
+    Args:
+        date_field: The date field of a 300 record, as bytes
+        
+    Returns:
+        Midnight at the start of the given date
+        
+    Raises:
+        ValueError: If the field is not a valid YYYYMMDD date
+    """
+    if len(date_field) != 8 or not date_field.isdigit():
+        raise ValueError(f"not a YYYYMMDD date: {date_field!r}")
+    return datetime(int(date_field[:4]), int(date_field[4:6]), int(date_field[6:]))
+
+
+@lru_cache(maxsize=None)
+def interval_offsets(interval_minutes: int, count: int) -> tuple[timedelta, ...]:
+    """
+    Return the offsets from midnight at which each interval ends.
+    
+    Interval 1 ends one interval length after midnight, interval 2 two
+    lengths after, and so on. The result only depends on the interval
+    length, so it is computed once and shared by every 300 record.
+    
+    Args:
+        interval_minutes: The interval length in minutes
+        count: Number of intervals in the day
+        
+    Returns:
+        Tuple of ``count`` timedelta offsets
+    """
+    return tuple(
+        timedelta(minutes=i * interval_minutes) for i in range(1, count + 1)
+    )
+
+
+@lru_cache(maxsize=1024)
+def day_timestamps(interval_date: datetime, interval_minutes: int) -> tuple[datetime, ...]:
+    """
+    Return the end-of-interval timestamp of every interval on a date.
+    
+    Files normally hold many NMIs or registers over the same range of
+    dates, so each day's timestamps are computed once and the datetime
+    objects are shared by every 300 record for that date.
+    
+    Args:
+        interval_date: Midnight at the start of the day
+        interval_minutes: The interval length in minutes
+        
+    Returns:
+        Tuple indexed by interval number: entry ``i`` is the end of
+        interval ``i``, and entry 0 is ``interval_date`` itself
+    """
+    offsets = interval_offsets(interval_minutes, (24 * 60) // interval_minutes)
+    return (interval_date, *map(interval_date.__add__, offsets))
+
+
+def parse_values(fields: Sequence[bytes]) -> list[float | None] | None:
+    """
+    Convert all interval values of a 300 record in one pass.
+    
+    The whole record is screened with a single regex match up front, so
+    records with invalid values are normally rejected without raising
+    and catching an exception.
+    
+    Args:
+        fields: The raw interval value fields, as bytes
+        
+    Returns:
+        One entry per field: the parsed value, or None for an empty field.
+        Returns None instead if any field is not a finite non-negative
+        number, in which case the caller should check values one by one.
+    """
+    if not _RECORD_CHARS_RE.fullmatch(b",".join(fields)):
+        return None
+    try:
+        # Convert the whole record with map() so the loop runs in C. This
+        # only fails for records with empty fields, which are rare
+        values: list[float | None] = list(map(float, fields))
+    except ValueError:
+        try:
+            values = [float(field) if field.strip() else None for field in fields]
+        except ValueError:
+            # Only malformed numbers made of valid characters, such as "1..2"
+            return None
+    # The screen rules out signs and nan, so the only non-finite value left
+    # is infinity from an overlong digit string. filter(None, ...) drops
+    # empty fields (and zeros, which cannot be the maximum anyway)
+    if max(filter(None, values), default=0.0) == inf:
+        return None
+    return values
+
+
+for _minutes in STANDARD_INTERVAL_MINUTES:
+    interval_offsets(_minutes, (24 * 60) // _minutes)
+del _minutes
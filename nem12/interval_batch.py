@@ -0,0 +1,160 @@
+"""IntervalBatch dataclass representing the readings of one 300 record."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import repeat
+from operator import le
+from typing import Iterator, Sequence
+
+from ._fastparse import day_timestamps
+from .meter_reading import MeterReading
+
+
+@dataclass(frozen=True, slots=True)
+class IntervalBatch:
+    """
+    All readings from a single 300 record.
+    
+    Every reading in a 300 record shares the same NMI, date and interval
+    length, so they are kept together rather than expanded into one
+    MeterReading each. Consumers that format output can then do the
+    per-record work (such as formatting the date) once per batch.
+    
+    Attributes:
+        nmi: National Meter Identifier from the preceding 200 record
+        interval_date: Midnight at the start of the interval date
+        interval_minutes: The interval length in minutes
+        intervals: 1-based interval numbers that have a value
+        consumptions: Consumption values, parallel to ``intervals``
+    
+    The parser stores ``intervals`` as a range or an ``array('H')`` and
+    ``consumptions`` as an ``array('d')``, keeping a record's values in
+    one contiguous block rather than as separate float objects.
+    """
+    
+    nmi: str
+    interval_date: datetime
+    interval_minutes: int
+    intervals: Sequence[int]
+    consumptions: Sequence[float]
+    
+    def __post_init__(self) -> None:
+        """Validate the batch as a whole, once for all of its readings."""
+        if not self.nmi or len(self.nmi) > 10:
+            raise ValueError(f"Invalid NMI: '{self.nmi}' (must be 1-10 characters)")
+        if len(self.intervals) != len(self.consumptions):
+            raise ValueError("intervals and consumptions must have the same length")
+        if self.interval_minutes <= 0:
+            raise ValueError(f"Invalid interval length: {self.interval_minutes} minutes")
+        # Interval numbers index the day's timestamp table, where 0 is the
+        # start of the day rather than the end of an interval
+        intervals_per_day = (24 * 60) // self.interval_minutes
+        if self.intervals and (min(self.intervals) < 1 or max(self.intervals) > intervals_per_day):
+            raise ValueError(f"Invalid interval number in batch (must be 1-{intervals_per_day})")
+        # Rejects negative values and NaN in a single C-level pass. The
+        # operator form falls back to the value's own comparison, so Decimal
+        # values are checked too rather than yielding a truthy NotImplemented
+        try:
+            non_negative = all(map(le, repeat(0.0), self.consumptions))
+        except ArithmeticError:
+            # Decimal NaN raises InvalidOperation when ordered
+            non_negative = False
+        if not non_negative:
+            raise ValueError("Invalid consumption in batch (must be non-negative)")
+    
+    def __getstate__(self) -> tuple:
+        """Return the fields for pickling."""
+        return (
+            self.nmi,
+            self.interval_date,
+            self.interval_minutes,
+            self.intervals,
+            self.consumptions,
+        )
+    
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Restore a pickled batch, interning its NMI.
+        
+        parse_parallel() receives batches pickled one chunk at a time, and
+        each chunk would otherwise bring its own copy of every NMI.
+        """
+        nmi, interval_date, interval_minutes, intervals, consumptions = state
+        _set_nmi(self, sys.intern(nmi))
+        _set_interval_date(self, interval_date)
+        _set_interval_minutes(self, interval_minutes)
+        _set_intervals(self, intervals)
+        _set_consumptions(self, consumptions)
+    
+    @classmethod
+    def _unchecked(
+        cls,
+        nmi: str,
+        interval_date: datetime,
+        interval_minutes: int,
+        intervals: Sequence[int],
+        consumptions: Sequence[float]
+    ) -> IntervalBatch:
+        """
+        Create a batch from already-validated values, skipping __post_init__.
+        
+        The parser checks every value as it converts it, so validating the
+        batch again would be a second full pass over its values. Only for
+        callers that have validated the values themselves.
+        """
+        batch = object.__new__(cls)
+        _set_nmi(batch, nmi)
+        _set_interval_date(batch, interval_date)
+        _set_interval_minutes(batch, interval_minutes)
+        _set_intervals(batch, intervals)
+        _set_consumptions(batch, consumptions)
+        return batch
+    
+    def __len__(self) -> int:
+        """Return the number of readings in the batch."""
+        return len(self.consumptions)
+    
+    def timestamps(self) -> list[datetime]:
+        """
+        Return the end-of-interval timestamp of every reading in the batch.
+        
+        Timestamps are looked up in the cached table for the batch's date,
+        so no datetime arithmetic happens per reading.
+        
+        Returns:
+            One timestamp per interval value, parallel to ``consumptions``
+        """
+        day = day_timestamps(self.interval_date, self.interval_minutes)
+        
+        if isinstance(self.intervals, range) and self.intervals.start == 1:
+            # Full record: the leading timestamps are exactly the ones needed
+            return list(day[1:len(self.intervals) + 1])
+        
+        return list(map(day.__getitem__, self.intervals))
+    
+    def readings(self) -> Iterator[MeterReading]:
+        """
+        Expand the batch into individual MeterReading objects.
+        
+        The values were validated when the batch was created, so readings
+        are built without repeating the per-reading checks.
+        
+        Yields:
+            One MeterReading per interval value, in interval order
+        """
+        unchecked = MeterReading._unchecked
+        nmi = self.nmi
+        
+        for timestamp, consumption in zip(self.timestamps(), self.consumptions):
+            yield unchecked(nmi, timestamp, consumption)
+
+
+# Slot descriptor setters used by __setstate__ and IntervalBatch._unchecked
+_set_nmi = IntervalBatch.nmi.__set__
+_set_interval_date = IntervalBatch.interval_date.__set__
+_set_interval_minutes = IntervalBatch.interval_minutes.__set__
+_set_intervals = IntervalBatch.intervals.__set__
+_set_consumptions = IntervalBatch.consumptions.__set__
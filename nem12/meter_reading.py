@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
 
 
 @dataclass(frozen=True, slots=True)
@@ -22,11 +21,33 @@ class MeterReading:
     
     nmi: str
     timestamp: datetime
-    consumption: Decimal
+    consumption: float
     
     def __post_init__(self) -> None:
         """Validate meter reading data on creation."""
         if not self.nmi or len(self.nmi) > 10:
             raise ValueError(f"Invalid NMI: '{self.nmi}' (must be 1-10 characters)")
-        if self.consumption < 0:
+        # Written as a negated >= so that NaN is rejected as well
+        if not self.consumption >= 0:
             raise ValueError(f"Invalid consumption: {self.consumption} (must be non-negative)")
+    
+    @classmethod
+    def _unchecked(cls, nmi: str, timestamp: datetime, consumption: float) -> MeterReading:
+        """
+        Create a reading from already-validated values, skipping __post_init__.
+        
+        Fields are stored through their slot descriptors, which bypasses
+        both validation and the frozen dataclass __setattr__ workaround.
+        Only for callers that have validated the values in bulk.
+        """
+        reading = object.__new__(cls)
+        _set_nmi(reading, nmi)
+        _set_timestamp(reading, timestamp)
+        _set_consumption(reading, consumption)
+        return reading
+
+
+# Slot descriptor setters used by MeterReading._unchecked
+_set_nmi = MeterReading.nmi.__set__
+_set_timestamp = MeterReading.timestamp.__set__
+_set_consumption = MeterReading.consumption.__set__
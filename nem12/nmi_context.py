@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 
 
@@ -56,6 +57,14 @@ class NMIContext:
         nmi = fields[1].strip()
         if not nmi:
             raise ValueError("Invalid 200 record: empty NMI")
+        if len(nmi) > 10 or "'" in nmi:
+            raise ValueError(
+                f"Invalid 200 record: NMI '{nmi}' must be at most 10 characters "
+                f"and contain no quotes"
+            )
+        # The same NMI is shared by every reading under this record and
+        # usually recurs across many 200 records, so keep a single copy
+        nmi = sys.intern(nmi)
         
         try:
             interval_minutes = int(fields[8])
@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
-import csv
+import math
+import mmap
+import os
 import sys
-from datetime import datetime, timedelta
-from decimal import Decimal, InvalidOperation
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from itertools import compress, islice, repeat
+from operator import is_not
 from pathlib import Path
-from typing import Generator, TextIO
+from typing import BinaryIO, Generator, Iterable, Iterator
 
+from ._fastparse import VALUE_RE, parse_date, parse_values
+from .interval_batch import IntervalBatch
 from .meter_reading import MeterReading
 from .nmi_context import NMIContext
 
+try:
+    from ._cscan import scan_record
+except ImportError:
+    # The compiled 300 record scanner is optional (see setup.py); without
+    # it records are split and converted in Python
+    scan_record = None
+
+# Smallest chunk parse_parallel() cuts a file into by default. Below this,
+# dispatching a chunk to a worker costs more than parsing it
+_MIN_CHUNK_SIZE = 1 << 20
+
 
 class NEM12Parser:
     """
@@ -25,6 +44,9 @@ class NEM12Parser:
         parser = NEM12Parser()
         for reading in parser.parse(Path("meter_data.csv")):
             print(f"{reading.nmi}: {reading.consumption} at {reading.timestamp}")
+    
+    For bulk processing, parse_batches() yields one IntervalBatch per 300
+    record instead of one MeterReading per interval.
     """
     
     # Record type indicators
@@ -44,8 +66,8 @@ class NEM12Parser:
         """
         Parse a NEM12 file and yield MeterReading objects.
         
-        This is a generator that reads the file line by line, maintaining
-        minimal memory footprint regardless of file size.
+        This is a generator that memory-maps the file and walks it line by
+        line, maintaining minimal memory footprint regardless of file size.
         
         Args:
             file_path: Path to the NEM12 CSV file
@@ -53,6 +75,23 @@ class NEM12Parser:
         Yields:
             MeterReading objects for each interval reading
             
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is invalid
+        """
+        for batch in self.parse_batches(file_path):
+            yield from batch.readings()
+    
+    def parse_batches(self, file_path: Path) -> Generator[IntervalBatch, None, None]:
+        """
+        Parse a NEM12 file and yield one IntervalBatch per 300 record.
+        
+        Args:
+            file_path: Path to the NEM12 CSV file
+            
+        Yields:
+            IntervalBatch objects for each 300 record with at least one value
+            
         Raises:
             FileNotFoundError: If the file doesn't exist
             ValueError: If the file format is invalid
@@ -60,42 +99,367 @@ class NEM12Parser:
         self._current_context = None
         self._line_number = 0
         
-        with open(file_path, "r", encoding="utf-8", newline="") as f:
-            yield from self._parse_stream(f)
+        # Unbuffered: the file is either memory-mapped or read with
+        # readinto() into a large buffer, so Python-side buffering would
+        # only add a copy
+        with open(file_path, "rb", buffering=0) as f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files and pipes cannot be memory-mapped
+                yield from self._parse_stream(f)
+                return
+            with buf:
+                self._advise_sequential(f.fileno(), buf)
+                yield from self._parse_bytes(buf)
     
-    def _parse_stream(self, stream: TextIO) -> Generator[MeterReading, None, None]:
-        """Parse a text stream and yield MeterReading objects."""
-        reader = csv.reader(stream)
+    def parse_many(
+        self,
+        file_paths: Iterable[Path]
+    ) -> Generator[IntervalBatch, None, None]:
+        """
+        Parse several NEM12 files in turn and yield their batches in order.
         
-        for row in reader:
-            self._line_number += 1
+        While one file is parsed, the kernel is asked to start reading the
+        next, so its disk reads overlap with parsing rather than stalling
+        when it is opened.
+        
+        Args:
+            file_paths: Paths to the NEM12 CSV files
+            
+        Yields:
+            IntervalBatch objects for each 300 record with at least one value
+            
+        Raises:
+            FileNotFoundError: If a file doesn't exist
+            ValueError: If a file's format is invalid
+        """
+        paths = list(file_paths)
+        
+        for index, file_path in enumerate(paths):
+            if index + 1 < len(paths):
+                self._prefetch(paths[index + 1])
+            yield from self.parse_batches(file_path)
+    
+    def parse_columns(
+        self,
+        file_path: Path
+    ) -> tuple[list[str], list[datetime], array]:
+        """
+        Parse a NEM12 file into three parallel columns.
+        
+        Intended for handing readings to columnar tools. Each column is
+        extended once per 300 record rather than once per reading, and
+        consumptions are packed into a single ``array('d')``.
+        
+        Args:
+            file_path: Path to the NEM12 CSV file
+            
+        Returns:
+            (nmis, timestamps, consumptions), with one entry per reading
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is invalid
+        """
+        nmis: list[str] = []
+        timestamps: list[datetime] = []
+        consumptions = array("d")
+        
+        for batch in self.parse_batches(file_path):
+            nmis.extend(repeat(batch.nmi, len(batch)))
+            timestamps.extend(batch.timestamps())
+            consumptions.extend(batch.consumptions)
+        
+        return nmis, timestamps, consumptions
+    
+    def parse_parallel(
+        self,
+        file_path: Path,
+        workers: int | None = None,
+        chunk_size: int = 16 << 20
+    ) -> Generator[IntervalBatch, None, None]:
+        """
+        Parse a NEM12 file across multiple processes.
+        
+        The file is cut into chunks of roughly ``chunk_size`` bytes, each
+        starting at a 200 record so that every chunk carries its own NMI
+        context. Files too small to give every worker two chunks of that
+        size are cut finer, down to 1 MiB per chunk, so the workers still
+        share the load. Chunks are parsed in worker processes and their
+        batches are yielded in file order, so the output matches
+        parse_batches(). At most two chunks per worker are in flight at a
+        time.
+        
+        Args:
+            file_path: Path to the NEM12 CSV file
+            workers: Number of worker processes (default: CPU count)
+            chunk_size: Approximate maximum number of bytes per chunk
+            
+        Yields:
+            IntervalBatch objects for each 300 record with at least one value
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is invalid
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            yield from self.parse_batches(file_path)
+            return
+        
+        with open(file_path, "rb", buffering=0) as f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be memory-mapped; there is nothing to parse
+                return
+            except OSError:
+                # Pipes and other unmappable inputs cannot be cut into
+                # chunks. Parse them sequentially from the already open
+                # file, as parse_batches() does; reopening a pipe would
+                # lose its data
+                self._current_context = None
+                self._line_number = 0
+                yield from self._parse_stream(f)
+                return
+            
+            chunk_size = min(chunk_size, max(len(buf) // (2 * workers), _MIN_CHUNK_SIZE))
             
-            if not row:
+            with buf, ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = self._split_chunks(buf, chunk_size)
+                pending: deque[Future[tuple[list[IntervalBatch], bool]]] = deque()
+                finished = False
+                
+                while not finished:
+                    for start, end, first_line in islice(chunks, 2 * workers - len(pending)):
+                        pending.append(
+                            executor.submit(_parse_chunk, file_path, start, end, first_line)
+                        )
+                    if not pending:
+                        break
+                    
+                    batches, finished = pending.popleft().result()
+                    yield from batches
+                
+                # Chunks after the 900 record are not part of the data
+                for future in pending:
+                    future.cancel()
+    
+    @staticmethod
+    def _split_chunks(
+        buf: mmap.mmap,
+        chunk_size: int
+    ) -> Iterator[tuple[int, int, int]]:
+        """
+        Cut a buffer into chunks that each start at a 200 record.
+        
+        Yields:
+            (start, end, first_line) tuples, where first_line is the number
+            of lines preceding the chunk
+        """
+        size = len(buf)
+        start = 0
+        first_line = 0
+        
+        while start < size:
+            boundary = buf.find(_CHUNK_BOUNDARY, start + chunk_size)
+            end = size if boundary == -1 else boundary + 1
+            yield start, end, first_line
+            first_line += buf[start:end].count(b"\n")
+            start = end
+    
+    @staticmethod
+    def _advise_sequential(fd: int, buf: mmap.mmap) -> None:
+        """
+        Tell the kernel the file will be read once, front to back.
+        
+        This enables aggressive readahead so disk reads overlap with parsing.
+        Both hints are advisory and only exist on some platforms.
+        """
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                buf.madvise(mmap.MADV_SEQUENTIAL)
+            if hasattr(mmap, "MADV_WILLNEED"):
+                buf.madvise(mmap.MADV_WILLNEED)
+        except OSError:
+            # A rejected hint must not stop the parse
+            pass
+    
+    @staticmethod
+    def _prefetch(file_path: Path) -> None:
+        """
+        Ask the kernel to read a file into the page cache in the background.
+        
+        Failures are ignored: the file is opened normally when its turn
+        comes, and any error is raised then.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
+    def _parse_stream(
+        self,
+        stream: BinaryIO,
+        buffer_size: int = 1 << 20
+    ) -> Generator[IntervalBatch, None, bool]:
+        """
+        Parse a binary stream that cannot be memory-mapped.
+        
+        The stream is read with readinto() into a single reusable buffer.
+        Each fill is parsed up to its last complete line, and the trailing
+        partial line is moved to the front of the buffer for the next read.
+        The buffer only grows if a single line does not fit in it.
+        
+        Returns:
+            True if a 900 (end of data) record was reached
+        """
+        buf = bytearray(buffer_size)
+        view = memoryview(buf)
+        filled = 0
+        
+        while True:
+            count = stream.readinto(view[filled:])
+            if not count:
+                # End of stream: the last line may lack a trailing newline
+                return (yield from self._parse_bytes(buf, 0, filled))
+            filled += count
+            
+            complete = buf.rfind(b"\n", 0, filled) + 1
+            if complete == 0:
+                if filled == len(buf):
+                    # A single line fills the buffer; double it
+                    view.release()
+                    buf.extend(bytes(len(buf)))
+                    view = memoryview(buf)
                 continue
             
-            record_type = row[0].strip()
+            if (yield from self._parse_bytes(buf, 0, complete)):
+                return True
             
-            if record_type == self.RECORD_200:
-                self._current_context = NMIContext.from_record(row)
+            buf[:filled - complete] = buf[complete:filled]
+            filled -= complete
+    
+    def _parse_bytes(
+        self,
+        buf: bytes | bytearray | mmap.mmap,
+        start: int = 0,
+        end: int | None = None
+    ) -> Generator[IntervalBatch, None, bool]:
+        """
+        Parse a buffer of NEM12 data and yield IntervalBatch objects.
+        
+        Lines are located with ``find`` and split with ``bytes.split``, both
+        of which run in C. NEM12 fields are never quoted, so the general-purpose
+        CSV state machine is not needed. The record type is read from the
+        first four bytes, and each split stops after the fields that are used.
+        
+        Returns:
+            True if a 900 (end of data) record was reached
+        """
+        pos = start
+        if end is None:
+            end = len(buf)
+        
+        while pos < end:
+            line_end = buf.find(b"\n", pos, end)
+            if line_end == -1:
+                line_end = end
+            line = buf[pos:line_end].rstrip(b"\r")
+            pos = line_end + 1
+            self._line_number += 1
             
-            elif record_type == self.RECORD_300:
-                if self._current_context is None:
+            prefix = line[:4]
+            if prefix != _PREFIX_300 and prefix != _PREFIX_200:
+                # Rarer records, or a record indicator padded with blanks
+                prefix = line.split(b",", 1)[0].strip() + b","
+            
+            if prefix == _PREFIX_300:
+                context = self._current_context
+                if context is None:
                     raise ValueError(
                         f"Line {self._line_number}: 300 record found without preceding 200 record"
                     )
-                yield from self._parse_interval_record(row, self._current_context)
+                intervals_per_day = (24 * 60) // context.interval_minutes
+                if scan_record is not None:
+                    batch = self._scan_interval_record(line, context, intervals_per_day)
+                else:
+                    # Only the indicator, date and one day of values are needed;
+                    # the quality flag and trailing fields stay in one unsplit tail
+                    fields = line.split(b",", intervals_per_day + 2)
+                    batch = self._parse_interval_record(fields, context)
+                if batch:
+                    yield batch
+            
+            elif prefix == _PREFIX_200:
+                # NMIContext reads up to field 9 (IntervalLength)
+                row = [field.decode("utf-8") for field in line.split(b",", 10)]
+                self._current_context = NMIContext.from_record(row)
             
-            elif record_type == self.RECORD_900:
+            elif prefix == _PREFIX_900:
                 # End of file marker
-                break
+                return True
+        
+        return False
+    
+    def _scan_interval_record(
+        self,
+        line: bytes,
+        context: NMIContext,
+        intervals_per_day: int
+    ) -> IntervalBatch:
+        """
+        Parse a 300 record with the compiled scanner.
+        
+        The scanner splits the record and converts its values in a single
+        C pass. Records it does not accept as they are (too few fields, or
+        a value that is not a plain non-negative number) are handed to
+        _parse_interval_record(), which reports or skips them.
+        
+        Args:
+            line: The raw 300 record
+            context: The current NMI context from the preceding 200 record
+            intervals_per_day: Number of interval values in the record
+            
+        Returns:
+            IntervalBatch holding each valid interval value
+        """
+        scanned = scan_record(line, intervals_per_day)
+        if scanned is None:
+            fields = line.split(b",", intervals_per_day + 2)
+            return self._parse_interval_record(fields, context)
+        
+        date_field, intervals, consumptions = scanned
+        if intervals is None:
+            intervals = range(1, len(consumptions) + 1)
+        
+        # Every value was checked while being converted
+        return IntervalBatch._unchecked(
+            nmi=context.nmi,
+            interval_date=self._parse_record_date(date_field),
+            interval_minutes=context.interval_minutes,
+            intervals=intervals,
+            consumptions=consumptions
+        )
     
     def _parse_interval_record(
         self, 
-        fields: list[str], 
+        fields: list[bytes], 
         context: NMIContext
-    ) -> Generator[MeterReading, None, None]:
+    ) -> IntervalBatch:
         """
-        Parse a 300 interval data record and yield MeterReading objects.
+        Parse a 300 interval data record into an IntervalBatch.
         
         300 record format:
         - Field 1: Record indicator (300)
@@ -104,25 +468,18 @@ class NEM12Parser:
         - Remaining fields: Quality flag, reason codes, update dates (not used here)
         
         Args:
-            fields: List of field values from the CSV row
+            fields: List of raw field values from the CSV row
             context: The current NMI context from the preceding 200 record
             
-        Yields:
-            MeterReading objects for each valid interval value
+        Returns:
+            IntervalBatch holding each valid interval value
         """
         if len(fields) < 3:
             raise ValueError(
                 f"Line {self._line_number}: Invalid 300 record - insufficient fields"
             )
         
-        # Parse the interval date
-        date_str = fields[1].strip()
-        try:
-            interval_date = datetime.strptime(date_str, "%Y%m%d")
-        except ValueError as e:
-            raise ValueError(
-                f"Line {self._line_number}: Invalid date format '{date_str}'"
-            ) from e
+        interval_date = self._parse_record_date(fields[1])
         
         # Calculate how many intervals we expect based on interval length
         intervals_per_day = (24 * 60) // context.interval_minutes
@@ -135,32 +492,118 @@ class NEM12Parser:
             len(fields)
         )
         
-        for i, consumption_str in enumerate(
-            fields[consumption_start_index:consumption_end_index], 
-            start=1
-        ):
-            # Skip empty values
+        values = fields[consumption_start_index:consumption_end_index]
+        consumptions = parse_values(values)
+        if consumptions is None:
+            consumptions = self._parse_values_checked(
+                [value.decode("utf-8", "replace") for value in values]
+            )
+        
+        # Store values in typed arrays: 8 bytes per value instead of a float
+        # object each, and they pickle as raw bytes for parse_parallel()
+        intervals = range(1, len(consumptions) + 1)
+        if None in consumptions:
+            # Skip empty and invalid values, building the mask and applying
+            # it with map() and compress() rather than per-value branches
+            present = list(map(is_not, consumptions, repeat(None)))
+            intervals = array("H", compress(intervals, present))
+            consumptions = array("d", compress(consumptions, present))
+        else:
+            consumptions = array("d", consumptions)
+        
+        # Every value was checked while being converted
+        return IntervalBatch._unchecked(
+            nmi=context.nmi,
+            interval_date=interval_date,
+            interval_minutes=context.interval_minutes,
+            intervals=intervals,
+            consumptions=consumptions
+        )
+    
+    def _parse_record_date(self, date_field: bytes) -> datetime:
+        """Parse the date field of a 300 record, reporting the line if invalid."""
+        # bytes() is a no-op for mmap input; stream input is split from a
+        # bytearray, which cannot be a cache key
+        date_field = bytes(date_field.strip())
+        try:
+            return parse_date(date_field)
+        except ValueError as e:
+            date_str = date_field.decode("utf-8", "replace")
+            raise ValueError(
+                f"Line {self._line_number}: Invalid date format '{date_str}'"
+            ) from e
+    
+    def _parse_values_checked(self, values: list[str]) -> list[float | None]:
+        """
+        Parse interval values one by one, warning about invalid entries.
+        
+        Raises:
+            ValueError: If a value is negative
+        """
+        consumptions: list[float | None] = []
+        
+        for i, consumption_str in enumerate(values, start=1):
             consumption_str = consumption_str.strip()
             if not consumption_str:
+                consumptions.append(None)
                 continue
             
-            try:
-                consumption = Decimal(consumption_str)
-            except InvalidOperation:
+            if VALUE_RE.fullmatch(consumption_str.removeprefix("-")):
+                consumption = float(consumption_str)
+            else:
+                consumption = math.nan
+            
+            # Negative zero (such as "-0.000") is accepted as zero
+            if consumption < 0:
+                raise ValueError(
+                    f"Line {self._line_number}: Invalid consumption value "
+                    f"'{consumption_str}' at interval {i} (must be non-negative)"
+                )
+            
+            if math.isfinite(consumption):
+                consumptions.append(consumption)
+            else:
                 # Log warning and skip invalid values rather than failing entirely
                 print(
                     f"Warning: Line {self._line_number}: "
                     f"Skipping invalid consumption value '{consumption_str}' at interval {i}",
                     file=sys.stderr
                 )
-                continue
-            
-            # Calculate timestamp for this interval
-            # Interval 1 ends at 00:30 (for 30-min intervals), interval 2 at 01:00, etc.
-            timestamp = interval_date + timedelta(minutes=i * context.interval_minutes)
-            
-            yield MeterReading(
-                nmi=context.nmi,
-                timestamp=timestamp,
-                consumption=consumption
-            )
+                consumptions.append(None)
+        
+        return consumptions
+
+
+# Record indicators as they appear at the start of a raw line
+_PREFIX_200 = NEM12Parser.RECORD_200.encode() + b","
+_PREFIX_300 = NEM12Parser.RECORD_300.encode() + b","
+_PREFIX_900 = NEM12Parser.RECORD_900.encode() + b","
+
+# 200 record boundary searched for when cutting a file into chunks
+_CHUNK_BOUNDARY = b"\n" + _PREFIX_200
+
+
+def _parse_chunk(
+    file_path: Path,
+    start: int,
+    end: int,
+    first_line: int
+) -> tuple[list[IntervalBatch], bool]:
+    """
+    Parse one byte range of a NEM12 file in a worker process.
+    
+    Returns:
+        The batches found in the range, and whether a 900 record was reached
+    """
+    parser = NEM12Parser()
+    parser._line_number = first_line
+    
+    with open(file_path, "rb", buffering=0) as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            chunk = parser._parse_bytes(buf, start, end)
+            batches = []
+            while True:
+                try:
+                    batches.append(next(chunk))
+                except StopIteration as stop:
+                    return batches, stop.value
@@ -1,12 +1,69 @@
-"""SQLGenerator class for generating SQL INSERT statements."""
+"""SQLGenerator and COPYGenerator classes for generating SQL load statements."""
 
 from __future__ import annotations
 
-from typing import Generator, Iterable
+from array import array
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Generator, Iterable, Iterator, NamedTuple, Sequence
 
+from ._fastparse import STANDARD_INTERVAL_MINUTES
+from .interval_batch import IntervalBatch
 from .meter_reading import MeterReading
 
 
+class _RowFormat(NamedTuple):
+    """The literal text around each field of a rendered row."""
+    
+    start: str
+    after_nmi: str
+    after_timestamp: str
+    end: str
+    separator: str
+
+
+class _ValueStrings(dict):
+    """
+    Cache of consumption values to their text form.
+    
+    Meter data has few distinct values (a handful of decimals over a small
+    range), so looking a value up is several times cheaper than converting
+    it with str() every time. The cache is emptied when it reaches
+    MAX_SIZE entries to bound its memory on unusual data.
+    """
+    
+    MAX_SIZE = 1 << 16
+    
+    def __missing__(self, value: float) -> str:
+        if len(self) >= self.MAX_SIZE:
+            self.clear()
+        # -0.0 and 0.0 share a key, so both render the same way
+        text = self[value] = str(value + 0.0)
+        return text
+
+
+_value_strings = _ValueStrings()
+
+
+def _value_string(value: float) -> str:
+    """
+    Return the text of a consumption value.
+    
+    Only floats go through the cache: it is keyed by value, so a Decimal
+    or int would otherwise pick up the text of an equal float.
+    """
+    if type(value) is float:
+        return _value_strings[value]
+    return str(value)
+
+
+def _value_texts(consumptions: Sequence[float]) -> Iterator[str]:
+    """Return the text of each value, looking float arrays up directly."""
+    if isinstance(consumptions, array) and consumptions.typecode in "fd":
+        return map(_value_strings.__getitem__, consumptions)
+    return map(_value_string, consumptions)
+
+
 class SQLGenerator:
     """
     Generates SQL INSERT statements for meter readings.
@@ -23,6 +80,11 @@ class SQLGenerator:
     TABLE_NAME = "meter_readings"
     COLUMNS = ("nmi", "timestamp", "consumption")
     
+    # Rows are rendered as ('<nmi>', '<timestamp>', <consumption>)
+    _ROW_FORMAT = _RowFormat(
+        start="('", after_nmi="', '", after_timestamp="', ", end=")", separator=",\n"
+    )
+    
     def __init__(self, batch_size: int = 1000) -> None:
         """
         Initialize the SQL generator.
@@ -37,6 +99,18 @@ class SQLGenerator:
         if batch_size < 1:
             raise ValueError("batch_size must be at least 1")
         self.batch_size = batch_size
+        # Total rows across all statements yielded so far
+        self.rows_emitted = 0
+        
+        columns_str = ", ".join(f'"{col}"' for col in self.COLUMNS)
+        self._statement_prefix = f"INSERT INTO {self.TABLE_NAME} ({columns_str}) VALUES\n"
+        
+        # %-template for one row: (escaped NMI, timestamp, consumption)
+        fmt = self._ROW_FORMAT
+        self._row_template = "%s".join(
+            part.replace("%", "%%")
+            for part in (fmt.start, fmt.after_nmi, fmt.after_timestamp, fmt.end)
+        )
     
     def generate(
         self, 
@@ -51,31 +125,316 @@ class SQLGenerator:
         Yields:
             SQL INSERT statements as strings, each containing up to batch_size rows
         """
-        batch: list[str] = []
+        # Rows are rendered a whole statement at a time: the fields of
+        # every row are collected flat and substituted into a template with
+        # batch_size row slots in a single % operation. The template is
+        # built when the first statement fills, so short inputs never pay
+        # for a large batch_size
+        separator = self._ROW_FORMAT.separator.replace("%", "%%")
+        statement_template: str | None = None
+        fields: list[str] = []
+        pending = 0
+        last_nmi: str | None = None
+        nmi_escaped = ""
         
         for reading in readings:
-            value_tuple = self._format_value(reading)
-            batch.append(value_tuple)
+            # Consecutive readings almost always share an (interned) NMI, so
+            # escape it once per run rather than once per reading
+            if reading.nmi != last_nmi:
+                last_nmi = reading.nmi
+                nmi_escaped = self._escape_nmi(last_nmi)
+            
+            # isoformat gives the same text as strftime("%Y-%m-%d %H:%M:%S")
+            # for naive timestamps, without the locale-aware machinery
+            fields += (
+                nmi_escaped,
+                reading.timestamp.isoformat(" ", "seconds"),
+                _value_string(reading.consumption),
+            )
+            pending += 1
+            
+            if pending >= self.batch_size:
+                if statement_template is None:
+                    statement_template = separator.join([self._row_template] * self.batch_size)
+                self.rows_emitted += pending
+                yield self._build_insert_statement([statement_template % tuple(fields)])
+                fields = []
+                pending = 0
+        
+        # Yield any remaining rows
+        if pending:
+            self.rows_emitted += pending
+            template = separator.join([self._row_template] * pending)
+            yield self._build_insert_statement([template % tuple(fields)])
+    
+    def generate_batches(
+        self,
+        batches: Iterable[IntervalBatch]
+    ) -> Generator[str, None, None]:
+        """
+        Generate SQL INSERT statements from interval batches.
+        
+        Produces the same statements as generate() would for the expanded
+        readings, but each row is rendered by a formatter specialised for
+        its 300 record, so only the consumption value is formatted per row.
+        A complete day is rendered with one ``%`` operation per statement
+        it falls into, against a template covering those intervals.
+        
+        Args:
+            batches: Iterable of IntervalBatch objects
             
-            if len(batch) >= self.batch_size:
-                yield self._build_insert_statement(batch)
-                batch = []
+        Yields:
+            SQL INSERT statements as strings, each containing up to batch_size rows
+        """
+        # Each part is one row, or a whole record's rows already joined
+        # with the row separator, so the row count is tracked separately
+        parts: list[str] = []
+        pending = 0
+        last_nmi: str | None = None
+        nmi_escaped = ""
+        
+        for record in batches:
+            count = len(record)
+            if record.nmi != last_nmi:
+                last_nmi = record.nmi
+                nmi_escaped = self._escape_nmi(last_nmi)
+            full_day = range(1, (24 * 60) // record.interval_minutes + 1)
+            
+            if record.intervals == full_day:
+                template_key = (
+                    self._ROW_FORMAT,
+                    nmi_escaped,
+                    record.interval_date,
+                    record.interval_minutes
+                )
+                values = tuple(_value_texts(record.consumptions))
+                
+                if pending + count <= self.batch_size:
+                    parts.append(_record_template(*template_key) % values)
+                    pending += count
+                else:
+                    # Cut the day at statement boundaries, rendering each
+                    # piece with one template covering just its intervals
+                    pos = 0
+                    while pos < count:
+                        take = min(count - pos, self.batch_size - pending)
+                        template = _segment_template(*template_key, pos + 1, pos + take)
+                        parts.append(template % values[pos:pos + take])
+                        pending += take
+                        pos += take
+                        
+                        if pending >= self.batch_size:
+                            self.rows_emitted += pending
+                            yield self._build_insert_statement(parts)
+                            parts = []
+                            pending = 0
+            else:
+                format_rows = self._compile_record_template(
+                    nmi_escaped, record.interval_date, record.interval_minutes
+                )
+                rows = format_rows(record.intervals, record.consumptions)
+                
+                pos = 0
+                while pos < count:
+                    chunk = rows[pos:pos + self.batch_size - pending]
+                    parts.extend(chunk)
+                    pending += len(chunk)
+                    pos += len(chunk)
+                    
+                    if pending >= self.batch_size:
+                        self.rows_emitted += pending
+                        yield self._build_insert_statement(parts)
+                        parts = []
+                        pending = 0
+            
+            if pending >= self.batch_size:
+                self.rows_emitted += pending
+                yield self._build_insert_statement(parts)
+                parts = []
+                pending = 0
         
         # Yield any remaining rows
-        if batch:
-            yield self._build_insert_statement(batch)
-    
-    def _format_value(self, reading: MeterReading) -> str:
-        """Format a single reading as a SQL value tuple."""
-        # Escape single quotes in NMI (defensive)
-        nmi_escaped = reading.nmi.replace("'", "''")
-        timestamp_str = reading.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        if parts:
+            self.rows_emitted += pending
+            yield self._build_insert_statement(parts)
+    
+    def _compile_record_template(
+        self,
+        nmi_escaped: str,
+        interval_date: datetime,
+        interval_minutes: int
+    ) -> Callable[[Sequence[int], Sequence[float]], list[str]]:
+        """
+        Build a row formatter specialised for one 300 record.
+        
+        Everything in a row except the consumption value is fixed by the
+        NMI, date and interval number, so those prefixes are rendered up
+        front and each row becomes a single concatenation.
+        
+        Returns:
+            A function mapping (intervals, consumptions) to SQL value tuples
+        """
+        prefixes = _row_prefixes(
+            self._ROW_FORMAT, nmi_escaped, interval_date, interval_minutes
+        )
+        end = self._ROW_FORMAT.end
         
-        return f"('{nmi_escaped}', '{timestamp_str}', {reading.consumption})"
+        def format_rows(intervals: Sequence[int], consumptions: Sequence[float]) -> list[str]:
+            return [
+                prefixes[interval - 1] + text + end
+                for interval, text in zip(intervals, _value_texts(consumptions))
+            ]
+        
+        return format_rows
+    
+    def _escape_nmi(self, nmi: str) -> str:
+        """Escape an NMI for use inside a SQL string literal."""
+        return nmi.replace("'", "''")
     
     def _build_insert_statement(self, values: list[str]) -> str:
         """Build a multi-row INSERT statement."""
-        columns_str = ", ".join(f'"{col}"' for col in self.COLUMNS)
-        values_str = ",\n".join(values)
+        return self._statement_prefix + ",\n".join(values) + ";"
+
+
+class COPYGenerator(SQLGenerator):
+    """
+    Generates PostgreSQL COPY ... FROM STDIN blocks for meter readings.
+    
+    COPY is PostgreSQL's bulk load path and ingests rows far faster than
+    multi-row INSERT statements. Each block holds up to batch_size rows as
+    CSV lines and ends with the \\. terminator, so the output can be run
+    with psql.
+    
+    Example:
+        generator = COPYGenerator(batch_size=100000)
+        for block in generator.generate_batches(batches):
+            print(block)
+    """
+    
+    # Rows are rendered as <nmi>,<timestamp>,<consumption>
+    _ROW_FORMAT = _RowFormat(start="", after_nmi=",", after_timestamp=",", end="", separator="\n")
+    
+    def __init__(self, batch_size: int = 1000) -> None:
+        """
+        Initialize the COPY generator.
         
-        return f"INSERT INTO {self.TABLE_NAME} ({columns_str}) VALUES\n{values_str};"
+        Args:
+            batch_size: Number of rows per COPY block.
+                       
+        Raises:
+            ValueError: If batch_size is less than 1
+        """
+        super().__init__(batch_size)
+        columns_str = ", ".join(f'"{col}"' for col in self.COLUMNS)
+        self._statement_prefix = (
+            f"COPY {self.TABLE_NAME} ({columns_str}) FROM STDIN WITH (FORMAT csv);\n"
+        )
+    
+    def _escape_nmi(self, nmi: str) -> str:
+        """Quote an NMI as a CSV field if it contains special characters."""
+        if any(char in nmi for char in ',"\r\n'):
+            return '"' + nmi.replace('"', '""') + '"'
+        return nmi
+    
+    def _build_insert_statement(self, values: list[str]) -> str:
+        """Build a COPY block from CSV rows."""
+        return self._statement_prefix + "\n".join(values) + "\n\\."
+
+
+@lru_cache(maxsize=None)
+def _times_of_day(interval_minutes: int) -> tuple[str, ...]:
+    """Return the HH:MM:SS end time of every interval in a day."""
+    return tuple(
+        f"{hours:02d}:{minutes:02d}:00"
+        for hours, minutes in (
+            divmod(i * interval_minutes, 60)
+            for i in range(1, (24 * 60) // interval_minutes + 1)
+        )
+    )
+
+
+for _minutes in STANDARD_INTERVAL_MINUTES:
+    _times_of_day(_minutes)
+del _minutes
+
+
+@lru_cache(maxsize=1024)
+def _row_prefixes(
+    fmt: _RowFormat,
+    nmi_escaped: str,
+    interval_date: datetime,
+    interval_minutes: int
+) -> tuple[str, ...]:
+    """
+    Return each interval's row text up to, but excluding, the consumption.
+    
+    Cached because a file usually has several 200 records (one per
+    register) for the same NMI covering the same dates.
+    """
+    head = f"{fmt.start}{nmi_escaped}{fmt.after_nmi}{interval_date:%Y-%m-%d} "
+    prefixes = [
+        head + time_of_day + fmt.after_timestamp
+        for time_of_day in _times_of_day(interval_minutes)
+    ]
+    
+    if prefixes and (24 * 60) % interval_minutes == 0:
+        # The last interval of the day ends at midnight the next day
+        next_date = interval_date + timedelta(days=1)
+        prefixes[-1] = (
+            f"{fmt.start}{nmi_escaped}{fmt.after_nmi}{next_date:%Y-%m-%d} 00:00:00"
+            f"{fmt.after_timestamp}"
+        )
+    
+    return tuple(prefixes)
+
+
+@lru_cache(maxsize=1024)
+def _record_template(
+    fmt: _RowFormat,
+    nmi_escaped: str,
+    interval_date: datetime,
+    interval_minutes: int
+) -> str:
+    """Return a %-template rendering every interval of one day as rows."""
+    return _segment_template(
+        fmt, nmi_escaped, interval_date, interval_minutes,
+        1, (24 * 60) // interval_minutes
+    )
+
+
+def _segment_template(
+    fmt: _RowFormat,
+    nmi_escaped: str,
+    interval_date: datetime,
+    interval_minutes: int,
+    first: int,
+    last: int
+) -> str:
+    """
+    Return a %-template rendering intervals first to last (inclusive) as rows.
+    
+    The template has one ``%s`` per interval for its consumption value, and
+    the rows are already joined with the row separator. It is assembled
+    with a single str.join over the cached time-of-day table.
+    """
+    head = f"{fmt.start}{nmi_escaped}{fmt.after_nmi}{interval_date:%Y-%m-%d} "
+    head = head.replace("%", "%%")
+    times = _times_of_day(interval_minutes)[first - 1:last]
+    row_tail = f"{fmt.after_timestamp}%s{fmt.end}"
+    blocks = []
+    
+    if last == (24 * 60) // interval_minutes and (24 * 60) % interval_minutes == 0:
+        # The last interval of the day ends at midnight the next day
+        next_date = interval_date + timedelta(days=1)
+        next_head = f"{fmt.start}{nmi_escaped}{fmt.after_nmi}{next_date:%Y-%m-%d} "
+        last_row = next_head.replace("%", "%%") + "00:00:00" + row_tail
+        times = times[:-1]
+    else:
+        last_row = None
+    
+    if times:
+        blocks.append(head + f"{row_tail}{fmt.separator}{head}".join(times) + row_tail)
+    if last_row:
+        blocks.append(last_row)
+    
+    return fmt.separator.join(blocks)
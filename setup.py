@@ -0,0 +1,20 @@
+"""
+Build script for the optional compiled 300 record scanner.
+
+The nem12 package needs no build step and runs on the standard library
+alone. To build the scanner in place, which NEM12Parser then uses
+automatically:
+
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import Extension, setup
+
+setup(
+    name="nem12",
+    packages=["nem12"],
+    ext_modules=[
+        # optional=True lets installation continue without a C compiler
+        Extension("nem12._cscan", ["nem12/_cscan.c"], optional=True),
+    ],
+)
@@ -1,7 +1,12 @@
 """Integration tests for the process_file function."""
 
+import contextlib
+import io
 from pathlib import Path
 
+import pytest
+
+import main
 from main import process_file
 from tests.conftest import create_300_record, create_nem12_file
 
@@ -60,3 +65,139 @@ class TestProcessFile:
         # Should have 3 INSERT statements (2 + 2 + 1)
         sql_content = temp_sql_file.read_text()
         assert sql_content.count("INSERT INTO") == 3
+    
+    def test_process_to_stdout(self, temp_csv_file: Path, capsysbinary):
+        """Test that output goes to stdout when no output path is given."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, 0.6])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        total = process_file(temp_csv_file, batch_size=100)
+        
+        assert total == 2
+        output = capsysbinary.readouterr().out
+        assert b"INSERT INTO meter_readings" in output
+        assert b"Total readings: 2" in output
+    
+    def test_process_to_redirected_text_stdout(self, temp_csv_file: Path):
+        """Test that output is written as text when stdout has no binary buffer."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, 0.6])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            total = process_file(temp_csv_file, batch_size=100)
+        
+        assert total == 2
+        assert "INSERT INTO meter_readings" in output.getvalue()
+        assert "Total readings: 2" in output.getvalue()
+    
+    def test_process_with_workers(self, temp_csv_file: Path, temp_sql_file: Path):
+        """Test that parallel parsing produces the same readings."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [1.0, 2.0])}
+200,NEM1201010,E1E2,2,E2,,01009,kWh,30,20050610
+{create_300_record("20050301", [3.0])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        total = process_file(temp_csv_file, temp_sql_file, batch_size=100, workers=2)
+        
+        assert total == 3
+        assert "NEM1201010" in temp_sql_file.read_text()
+    
+    def test_process_copy_format(self, temp_csv_file: Path, temp_sql_file: Path):
+        """Test that the copy format writes COPY blocks instead of INSERTs."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, 0.6])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        total = process_file(temp_csv_file, temp_sql_file, batch_size=100, output_format="copy")
+        
+        assert total == 2
+        sql_content = temp_sql_file.read_text()
+        assert "INSERT INTO" not in sql_content
+        assert "COPY meter_readings" in sql_content
+        assert "NEM1201009,2005-03-01 00:30:00,0.5\nNEM1201009,2005-03-01 01:00:00,0.6\n\\.\n" in sql_content
+
+
+class TestGatherWriter:
+    """Tests for the writev-based output writer."""
+    
+    def test_partial_writes_are_resumed(self, monkeypatch):
+        """Test that buffers are written in full even when writev() is short."""
+        written = bytearray()
+        
+        def short_writev(fd, buffers):
+            # Write at most 5 bytes per call, like a full pipe would
+            data = b"".join(bytes(b) for b in buffers)[:5]
+            written.extend(data)
+            return len(data)
+        
+        monkeypatch.setattr(main.os, "writev", short_writev)
+        
+        writer = main._GatherWriter(fd=-1)
+        for chunk in (b"INSERT", b"", b"\n\n", b"-- Total readings: 3\n"):
+            writer.write(chunk)
+        writer.flush()
+        
+        assert bytes(written) == b"INSERT\n\n-- Total readings: 3\n"
+    
+    def test_failed_write_clears_queue(self, monkeypatch):
+        """Test that buffers are dropped when writev() fails, so flush does not raise twice."""
+        calls = []
+        
+        def failing_writev(fd, buffers):
+            calls.append(len(buffers))
+            raise OSError(28, "No space left on device")
+        
+        monkeypatch.setattr(main.os, "writev", failing_writev)
+        
+        writer = main._GatherWriter(fd=-1)
+        writer.write(b"INSERT")
+        with pytest.raises(OSError):
+            writer.flush()
+        writer.flush()
+        
+        assert calls == [1]
+    
+    @pytest.mark.skipif(not hasattr(main.os, "writev"), reason="requires os.writev")
+    def test_output_file_closed_when_write_fails(
+        self, temp_csv_file: Path, temp_sql_file: Path, monkeypatch
+    ):
+        """Test that process_file closes the output file when the final write fails."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        opened = []
+        
+        def recording_open(*args, **kwargs):
+            f = open(*args, **kwargs)
+            opened.append(f)
+            return f
+        
+        def failing_writev(fd, buffers):
+            raise OSError(28, "No space left on device")
+        
+        monkeypatch.setattr(main, "open", recording_open, raising=False)
+        monkeypatch.setattr(main.os, "writev", failing_writev)
+        
+        with pytest.raises(OSError, match="No space left"):
+            process_file(temp_csv_file, temp_sql_file)
+        
+        assert opened and opened[0].closed
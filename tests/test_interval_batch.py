@@ -0,0 +1,125 @@
+"""Tests for the IntervalBatch dataclass."""
+
+import pickle
+import sys
+from array import array
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from nem12 import IntervalBatch
+
+
+class TestIntervalBatch:
+    """Tests for the IntervalBatch dataclass."""
+    
+    def test_len_counts_readings(self):
+        """Test that len() returns the number of values in the batch."""
+        batch = IntervalBatch(
+            nmi="NEM1201009",
+            interval_date=datetime(2005, 3, 1),
+            interval_minutes=30,
+            intervals=[1, 3],
+            consumptions=[0.5, 0.7]
+        )
+        assert len(batch) == 2
+    
+    def test_readings_expand_with_timestamps(self):
+        """Test that readings() yields one MeterReading per interval value."""
+        batch = IntervalBatch(
+            nmi="NEM1201009",
+            interval_date=datetime(2005, 3, 1),
+            interval_minutes=30,
+            intervals=[1, 3, 48],
+            consumptions=[0.5, 0.7, 1.0]
+        )
+        readings = list(batch.readings())
+        
+        assert [r.nmi for r in readings] == ["NEM1201009"] * 3
+        assert readings[0].timestamp == datetime(2005, 3, 1, 0, 30)
+        assert readings[1].timestamp == datetime(2005, 3, 1, 1, 30)
+        assert readings[2].timestamp == datetime(2005, 3, 2, 0, 0)
+        assert [r.consumption for r in readings] == [0.5, 0.7, 1.0]
+    
+    def test_timestamps_for_full_record(self):
+        """Test timestamps for a batch holding every interval of the day."""
+        batch = IntervalBatch(
+            nmi="NEM1201009",
+            interval_date=datetime(2005, 3, 1),
+            interval_minutes=15,
+            intervals=range(1, 97),
+            consumptions=[1.0] * 96
+        )
+        timestamps = batch.timestamps()
+        
+        assert len(timestamps) == 96
+        assert timestamps[0] == datetime(2005, 3, 1, 0, 15)
+        assert timestamps[-1] == datetime(2005, 3, 2, 0, 0)
+    
+    def test_pickle_round_trip_interns_nmi(self):
+        """Test that unpickled batches are equal and share the interned NMI."""
+        batch = IntervalBatch(
+            nmi="".join(["NEM12", "01009"]),
+            interval_date=datetime(2005, 3, 1),
+            interval_minutes=30,
+            intervals=array("H", [1, 3]),
+            consumptions=array("d", [0.5, 0.7])
+        )
+        restored = pickle.loads(pickle.dumps(batch))
+        
+        assert restored == batch
+        assert restored.nmi is sys.intern("NEM1201009")
+    
+    def test_negative_consumption_raises_error(self):
+        """Test that a batch containing a negative value raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid consumption"):
+            IntervalBatch(
+                nmi="NEM1201009",
+                interval_date=datetime(2005, 3, 1),
+                interval_minutes=30,
+                intervals=[1, 2],
+                consumptions=[0.5, -1.0]
+            )
+        for invalid in (Decimal("-1.5"), Decimal("NaN")):
+            with pytest.raises(ValueError, match="Invalid consumption"):
+                IntervalBatch(
+                    nmi="NEM1201009",
+                    interval_date=datetime(2005, 3, 1),
+                    interval_minutes=30,
+                    intervals=[1, 2],
+                    consumptions=[Decimal("0.5"), invalid]
+                )
+    
+    def test_interval_zero_raises_error(self):
+        """Test that interval 0, the start of the day, raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid interval number"):
+            IntervalBatch(
+                nmi="NEM1201009",
+                interval_date=datetime(2005, 3, 1),
+                interval_minutes=30,
+                intervals=[0, 1],
+                consumptions=[0.5, 0.6]
+            )
+    
+    def test_interval_past_end_of_day_raises_error(self):
+        """Test that an interval beyond the day's interval count raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid interval number"):
+            IntervalBatch(
+                nmi="NEM1201009",
+                interval_date=datetime(2005, 3, 1),
+                interval_minutes=30,
+                intervals=[48, 49],
+                consumptions=[0.5, 0.6]
+            )
+    
+    def test_invalid_nmi_raises_error(self):
+        """Test that a batch with an over-long NMI raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid NMI"):
+            IntervalBatch(
+                nmi="A" * 11,
+                interval_date=datetime(2005, 3, 1),
+                interval_minutes=30,
+                intervals=[1],
+                consumptions=[0.5]
+            )
@@ -1,7 +1,6 @@
 """Tests for the MeterReading dataclass."""
 
 from datetime import datetime
-from decimal import Decimal
 
 import pytest
 
@@ -16,11 +15,11 @@ class TestMeterReading:
         reading = MeterReading(
             nmi="NEM1201009",
             timestamp=datetime(2005, 3, 1, 0, 30),
-            consumption=Decimal("0.461")
+            consumption=0.461
         )
         assert reading.nmi == "NEM1201009"
         assert reading.timestamp == datetime(2005, 3, 1, 0, 30)
-        assert reading.consumption == Decimal("0.461")
+        assert reading.consumption == 0.461
     
     def test_empty_nmi_raises_error(self):
         """Test that empty NMI raises ValueError."""
@@ -28,7 +27,7 @@ class TestMeterReading:
             MeterReading(
                 nmi="",
                 timestamp=datetime(2005, 3, 1, 0, 30),
-                consumption=Decimal("0.461")
+                consumption=0.461
             )
     
     def test_nmi_too_long_raises_error(self):
@@ -37,7 +36,7 @@ class TestMeterReading:
             MeterReading(
                 nmi="A" * 11,
                 timestamp=datetime(2005, 3, 1, 0, 30),
-                consumption=Decimal("0.461")
+                consumption=0.461
             )
     
     def test_negative_consumption_raises_error(self):
@@ -46,7 +45,16 @@ class TestMeterReading:
             MeterReading(
                 nmi="NEM1201009",
                 timestamp=datetime(2005, 3, 1, 0, 30),
-                consumption=Decimal("-1.5")
+                consumption=-1.5
+            )
+    
+    def test_nan_consumption_raises_error(self):
+        """Test that NaN consumption raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid consumption"):
+            MeterReading(
+                nmi="NEM1201009",
+                timestamp=datetime(2005, 3, 1, 0, 30),
+                consumption=float("nan")
             )
     
     def test_zero_consumption_is_valid(self):
@@ -54,16 +62,28 @@ class TestMeterReading:
         reading = MeterReading(
             nmi="NEM1201009",
             timestamp=datetime(2005, 3, 1, 0, 30),
-            consumption=Decimal("0")
+            consumption=0.0
         )
-        assert reading.consumption == Decimal("0")
+        assert reading.consumption == 0.0
     
     def test_immutability(self):
         """Test that MeterReading instances are immutable."""
         reading = MeterReading(
             nmi="NEM1201009",
             timestamp=datetime(2005, 3, 1, 0, 30),
-            consumption=Decimal("0.461")
+            consumption=0.461
+        )
+        with pytest.raises(AttributeError):
+            reading.nmi = "CHANGED"
+    
+    def test_unchecked_matches_validated_constructor(self):
+        """Test that _unchecked builds an equal, still immutable, reading."""
+        reading = MeterReading._unchecked("NEM1201009", datetime(2005, 3, 1, 0, 30), 0.461)
+        
+        assert reading == MeterReading(
+            nmi="NEM1201009",
+            timestamp=datetime(2005, 3, 1, 0, 30),
+            consumption=0.461
         )
         with pytest.raises(AttributeError):
             reading.nmi = "CHANGED"
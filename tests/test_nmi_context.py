@@ -42,12 +42,34 @@ class TestNMIContext:
         with pytest.raises(ValueError, match="empty NMI"):
             NMIContext.from_record(fields)
     
+    def test_nmi_too_long_raises_error(self):
+        """Test that an NMI longer than 10 characters raises ValueError."""
+        fields = ["200", "NEM12010091", "E1E2", "1", "E1", "N1", "01009", "kWh", "30", "20050610"]
+        with pytest.raises(ValueError, match="at most 10 characters"):
+            NMIContext.from_record(fields)
+    
+    def test_nmi_with_quote_raises_error(self):
+        """Test that an NMI containing a single quote raises ValueError."""
+        fields = ["200", "NEM'1009", "E1E2", "1", "E1", "N1", "01009", "kWh", "30", "20050610"]
+        with pytest.raises(ValueError, match="contain no quotes"):
+            NMIContext.from_record(fields)
+    
     def test_whitespace_nmi_is_stripped(self):
         """Test that whitespace around NMI is stripped."""
         fields = ["200", "  NEM1201009  ", "E1E2", "1", "E1", "N1", "01009", "kWh", "30", "20050610"]
         context = NMIContext.from_record(fields)
         assert context.nmi == "NEM1201009"
     
+    def test_nmi_is_interned(self):
+        """Test that repeated NMIs share a single string object."""
+        first = NMIContext.from_record(
+            ["200", "".join(["NEM", "1201009"]), "E1E2", "1", "E1", "N1", "01009", "kWh", "30", "20050610"]
+        )
+        second = NMIContext.from_record(
+            ["200", "".join(["NEM1201", "009"]), "E1E2", "2", "E2", "", "01009", "kWh", "30", "20050610"]
+        )
+        assert first.nmi is second.nmi
+    
     def test_invalid_interval_raises_error(self):
         """Test that non-numeric interval raises ValueError."""
         fields = ["200", "NEM1201009", "E1E2", "1", "E1", "N1", "01009", "kWh", "abc", "20050610"]
@@ -1,11 +1,14 @@
 """Tests for the NEM12Parser class."""
 
+import io
+import os
+import threading
 from datetime import datetime
-from decimal import Decimal
 from pathlib import Path
 
 import pytest
 
+import nem12.parser
 from nem12 import NEM12Parser
 from tests.conftest import create_300_record, create_nem12_file
 
@@ -31,15 +34,15 @@ class TestNEM12Parser:
         # Check first reading
         assert readings[0].nmi == "NEM1201009"
         assert readings[0].timestamp == datetime(2005, 3, 1, 0, 30)
-        assert readings[0].consumption == Decimal("0.5")
+        assert readings[0].consumption == 0.5
         
         # Check second reading
         assert readings[1].timestamp == datetime(2005, 3, 1, 1, 0)
-        assert readings[1].consumption == Decimal("0.6")
+        assert readings[1].consumption == 0.6
         
         # Check third reading
         assert readings[2].timestamp == datetime(2005, 3, 1, 1, 30)
-        assert readings[2].consumption == Decimal("0.7")
+        assert readings[2].consumption == 0.7
     
     def test_parse_multiple_nmi(self, temp_csv_file: Path):
         """Test parsing file with multiple 200 records (different NMIs)."""
@@ -119,13 +122,106 @@ class TestNEM12Parser:
         
         # Should have 2 readings (skipping the empty one)
         assert len(readings) == 2
-        assert readings[0].consumption == Decimal("0.5")
-        assert readings[1].consumption == Decimal("0.7")
+        assert readings[0].consumption == 0.5
+        assert readings[1].consumption == 0.7
         
         # Timestamps should be for intervals 1 and 3
         assert readings[0].timestamp == datetime(2005, 3, 1, 0, 30)
         assert readings[1].timestamp == datetime(2005, 3, 1, 1, 30)
     
+    def test_skip_invalid_consumption_values(self, temp_csv_file: Path, capsys):
+        """Test that invalid consumption values are skipped with a warning."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, "abc", 0.7])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        readings = list(parser.parse(temp_csv_file))
+        
+        assert len(readings) == 2
+        assert readings[0].timestamp == datetime(2005, 3, 1, 0, 30)
+        assert readings[1].timestamp == datetime(2005, 3, 1, 1, 30)
+        assert "Skipping invalid consumption value 'abc' at interval 2" in capsys.readouterr().err
+    
+    def test_skip_non_finite_consumption_values(self, temp_csv_file: Path, capsys):
+        """Test that spellings float() accepts but NEM12 does not are treated as invalid."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", ["nan", 0.6, "inf", "1_0", "1e999", "1..2"])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        readings = list(parser.parse(temp_csv_file))
+        
+        assert len(readings) == 1
+        assert readings[0].consumption == 0.6
+        warnings = capsys.readouterr().err
+        assert "'nan' at interval 1" in warnings
+        assert "'inf' at interval 3" in warnings
+        assert "'1_0' at interval 4" in warnings
+        assert "'1e999' at interval 5" in warnings
+        assert "'1..2' at interval 6" in warnings
+    
+    def test_skip_overflowing_value_in_complete_record(self, temp_csv_file: Path, capsys):
+        """Test that an overflowing value is caught when no interval is empty."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5] * 47 + ["1e999"])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        readings = list(parser.parse(temp_csv_file))
+        
+        assert len(readings) == 47
+        assert "'1e999' at interval 48" in capsys.readouterr().err
+    
+    def test_negative_consumption_raises_error(self, temp_csv_file: Path):
+        """Test that a negative consumption value raises error."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, -1.5])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        with pytest.raises(ValueError, match="'-1.5' at interval 2 \\(must be non-negative\\)"):
+            list(parser.parse_batches(temp_csv_file))
+    
+    def test_negative_zero_consumption_is_accepted(self, temp_csv_file: Path):
+        """Test that a negative zero such as -0.000 is read as zero."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, "-0.000", 0.7])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        readings = list(parser.parse(temp_csv_file))
+        
+        assert [r.consumption for r in readings] == [0.5, 0.0, 0.7]
+    
+    def test_invalid_date_raises_error(self, temp_csv_file: Path):
+        """Test that a 300 record with an invalid date raises error."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050230", [0.5])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        with pytest.raises(ValueError, match="Invalid date format '20050230'"):
+            list(parser.parse(temp_csv_file))
+    
     def test_300_without_200_raises_error(self, temp_csv_file: Path):
         """Test that 300 record without preceding 200 record raises error."""
         content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
@@ -155,6 +251,236 @@ class TestNEM12Parser:
         # Should only have reading from before the 900 record
         assert len(readings) == 1
         assert readings[0].nmi == "NEM1201009"
+    
+    def test_parse_crlf_line_endings(self, temp_csv_file: Path):
+        """Test that Windows-style line endings are handled."""
+        content = (
+            "100,NEM12,200506081149,UNITEDDP,NEMMCO\r\n"
+            "200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610\r\n"
+            f"{create_300_record('20050301', [0.5, 0.6])}\r\n"
+            "900\r\n"
+        )
+        temp_csv_file.write_bytes(content.encode("utf-8"))
+        
+        parser = NEM12Parser()
+        readings = list(parser.parse(temp_csv_file))
+        
+        assert len(readings) == 2
+        assert readings[0].nmi == "NEM1201009"
+        assert readings[1].timestamp == datetime(2005, 3, 1, 1, 0)
+    
+    def test_parse_empty_file(self, temp_csv_file: Path):
+        """Test that an empty file yields no readings."""
+        create_nem12_file("", temp_csv_file)
+        
+        parser = NEM12Parser()
+        assert list(parser.parse(temp_csv_file)) == []
+    
+    def test_rejected_access_hints_are_ignored(self, temp_csv_file: Path, monkeypatch):
+        """Test that an OSError from posix_fadvise does not stop the parse."""
+        def reject(*args):
+            raise OSError(22, "Invalid argument")
+        
+        monkeypatch.setattr(os, "posix_fadvise", reject, raising=False)
+        monkeypatch.setattr(os, "POSIX_FADV_SEQUENTIAL", 2, raising=False)
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        readings = list(parser.parse(temp_csv_file))
+        
+        assert len(readings) == 1
+    
+    def test_parse_batches_groups_by_record(self, temp_csv_file: Path):
+        """Test that parse_batches yields one batch per 300 record."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, "", 0.7])}
+{create_300_record("20050302", [])}
+{create_300_record("20050303", [1.0])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        batches = list(parser.parse_batches(temp_csv_file))
+        
+        # The record with no values produces no batch
+        assert len(batches) == 2
+        assert batches[0].nmi == "NEM1201009"
+        assert batches[0].interval_date == datetime(2005, 3, 1)
+        assert batches[0].interval_minutes == 30
+        assert list(batches[0].intervals) == [1, 3]
+        assert list(batches[0].consumptions) == [0.5, 0.7]
+        assert batches[1].interval_date == datetime(2005, 3, 3)
+    
+    def test_batches_share_parsed_dates(self, temp_csv_file: Path):
+        """Test that records for the same date share one datetime object."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5])}
+200,NEM1201010,E1E2,2,E2,,01009,kWh,30,20050610
+{create_300_record("20050301", [1.0])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        first, second = parser.parse_batches(temp_csv_file)
+        
+        assert first.interval_date is second.interval_date
+    
+    def test_parse_many_concatenates_files(self, temp_csv_file: Path, tmp_path: Path):
+        """Test that parse_many yields each file's batches in order."""
+        create_nem12_file(f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5])}
+900
+""", temp_csv_file)
+        second = create_nem12_file(f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201010,E1E2,1,E1,N1,01009,kWh,15,20050610
+{create_300_record("20050302", [1.0, 2.0])}
+900
+""", tmp_path / "second.csv")
+        
+        parser = NEM12Parser()
+        batches = list(parser.parse_many([temp_csv_file, second]))
+        
+        assert [batch.nmi for batch in batches] == ["NEM1201009", "NEM1201010"]
+        assert batches == (
+            list(parser.parse_batches(temp_csv_file)) + list(parser.parse_batches(second))
+        )
+    
+    def test_parse_columns_matches_parse(self, temp_csv_file: Path):
+        """Test that parse_columns returns the readings as parallel columns."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, "", 0.7])}
+200,NEM1201010,E1E2,2,E2,,01009,kWh,30,20050610
+{create_300_record("20050301", [1.0])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        nmis, timestamps, consumptions = parser.parse_columns(temp_csv_file)
+        readings = list(parser.parse(temp_csv_file))
+        
+        assert nmis == [r.nmi for r in readings]
+        assert timestamps == [r.timestamp for r in readings]
+        assert list(consumptions) == [r.consumption for r in readings]
+        assert len(consumptions) == 3
+    
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+    def test_parse_parallel_reads_pipes(self, tmp_path: Path):
+        """Test that parse_parallel parses unmappable inputs sequentially."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, 0.6])}
+900
+"""
+        fifo = tmp_path / "input.csv"
+        os.mkfifo(fifo)
+        writer = threading.Thread(target=fifo.write_text, args=(content,))
+        writer.start()
+        
+        parser = NEM12Parser()
+        batches = list(parser.parse_parallel(fifo, workers=2))
+        writer.join()
+        
+        assert len(batches) == 1
+        assert list(batches[0].consumptions) == [0.5, 0.6]
+    
+    def test_parse_parallel_matches_parse_batches(self, temp_csv_file: Path):
+        """Test that parallel parsing yields the same batches in the same order."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, "", 0.7])}
+{create_300_record("20050302", [1.0])}
+200,NEM1201010,E1E2,2,E2,,01009,kWh,15,20050610
+{create_300_record("20050301", [2.0, 3.0])}
+200,NEM1201011,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [4.0])}
+900
+200,SHOULDNOTPARSE,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [5.0])}
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        expected = list(parser.parse_batches(temp_csv_file))
+        # A tiny chunk size forces one chunk per 200 record
+        actual = list(parser.parse_parallel(temp_csv_file, workers=2, chunk_size=1))
+        
+        assert [b.nmi for b in actual] == ["NEM1201009", "NEM1201009", "NEM1201010", "NEM1201011"]
+        assert actual == expected
+    
+    def test_parse_parallel_splits_small_files_across_workers(
+        self, temp_csv_file: Path, monkeypatch
+    ):
+        """Test that a file below the default chunk size is still cut into several chunks."""
+        records = [
+            f"200,NEM{i:07d},E1E2,1,E1,N1,01009,kWh,30,20050610\n"
+            f"{create_300_record('20050301', [0.5] * 48)}\n"
+            for i in range(8000)
+        ]
+        content = "100,NEM12,200506081149,UNITEDDP,NEMMCO\n" + "".join(records) + "900\n"
+        create_nem12_file(content, temp_csv_file)
+        assert temp_csv_file.stat().st_size > 2 << 20
+        
+        chunks = []
+        split_chunks = NEM12Parser._split_chunks
+        
+        def recording_split_chunks(buf, chunk_size):
+            chunks.extend(split_chunks(buf, chunk_size))
+            return iter(chunks)
+        
+        monkeypatch.setattr(NEM12Parser, "_split_chunks", staticmethod(recording_split_chunks))
+        
+        parser = NEM12Parser()
+        batches = list(parser.parse_parallel(temp_csv_file, workers=2))
+        
+        assert len(chunks) > 1
+        assert len(batches) == 8000
+    
+    def test_parse_parallel_reports_file_line_numbers(self, temp_csv_file: Path):
+        """Test that errors in later chunks report their line in the whole file."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [1.0])}
+200,NEM1201010,E1E2,2,E2,,01009,kWh,30,20050610
+{create_300_record("2005031", [2.0])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        with pytest.raises(ValueError, match="Line 5: Invalid date format"):
+            list(parser.parse_parallel(temp_csv_file, workers=2, chunk_size=1))
+    
+    def test_parse_stream_with_small_buffer(self, temp_csv_file: Path):
+        """Test that lines split across buffer refills are reassembled."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, "", 0.7])}
+200,NEM1201010,E1E2,2,E2,,01009,kWh,15,20050610
+{create_300_record("20050302", [1.0])}
+900"""
+        create_nem12_file(content, temp_csv_file)
+        
+        expected = list(NEM12Parser().parse_batches(temp_csv_file))
+        
+        # A buffer smaller than any line exercises both the carry and growth paths
+        parser = NEM12Parser()
+        stream = io.BytesIO(content.encode("utf-8"))
+        actual = list(parser._parse_stream(stream, buffer_size=16))
+        
+        assert len(actual) == 2
+        assert actual == expected
 
 
 class TestTimestampCalculation:
@@ -214,3 +540,81 @@ class TestTimestampCalculation:
         for i, (hour, minute) in enumerate(expected_times):
             assert readings[i].timestamp.hour == hour
             assert readings[i].timestamp.minute == minute
+
+
+@pytest.mark.skipif(nem12.parser.scan_record is None, reason="compiled scanner not built")
+class TestCompiledScanner:
+    """Tests that the optional compiled 300 record scanner matches the Python path."""
+    
+    def test_batches_match_python_path(self, temp_csv_file: Path, monkeypatch, capsys):
+        """Test that the scanner yields the same batches and warnings as the Python path."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5 + i for i in range(48)])}
+{create_300_record("20050302", [0.5, "", " 0.7 ", "+1.5", "1e-3", ".5", "5.", "0"])}
+{create_300_record("20050303", ["", "", ""])}
+{create_300_record("20050304", [0.5, "abc", 0.7])}
+{create_300_record("20050305", [0.5, "-0.000", "1" * 400, "1e999", "1..2"])}
+300,20050306,1.25,2.5
+300,20050307,
+200,NEM1201010,E1E2,2,E2,,01009,kWh,5,20050610
+300,20050301,{",".join(["0.125"] * 288)},A,,,20050310121004,20050310182204
+200,NEM1201011,E1E2,1,E1,N1,01009,kWh,15,20050610
+300,20050301,{",".join(["2"] * 96)},{",".join(["9"] * 10)},A
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        scanned = list(NEM12Parser().parse_batches(temp_csv_file))
+        scanned_warnings = capsys.readouterr().err
+        monkeypatch.setattr(nem12.parser, "scan_record", None)
+        expected = list(NEM12Parser().parse_batches(temp_csv_file))
+        expected_warnings = capsys.readouterr().err
+        
+        assert scanned == expected
+        assert [type(b.intervals) for b in scanned] == [type(b.intervals) for b in expected]
+        assert scanned_warnings == expected_warnings
+        assert "'abc' at interval 2" in scanned_warnings
+    
+    def test_parse_dispatches_to_scanner(self, temp_csv_file: Path, monkeypatch):
+        """Test that 300 records are handed to the scanner when it is built."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050301", [0.5, 0.6])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        calls = []
+        scan_record = nem12.parser.scan_record
+        
+        def recording_scan_record(line, count):
+            calls.append(count)
+            return scan_record(line, count)
+        
+        monkeypatch.setattr(nem12.parser, "scan_record", recording_scan_record)
+        readings = list(NEM12Parser().parse(temp_csv_file))
+        
+        assert calls == [48]
+        assert [r.consumption for r in readings] == [0.5, 0.6]
+    
+    def test_unaccepted_records_fall_back(self):
+        """Test that the scanner returns None for records the Python path must check."""
+        scan_record = nem12.parser.scan_record
+        
+        assert scan_record(b"300,20050301", 48) is None
+        assert scan_record(b"300,20050301,0.5,abc", 48) is None
+        assert scan_record(b"300,20050301,0.5,-1.5", 48) is None
+        assert scan_record(b"300,20050301,1e999", 48) is None
+    
+    def test_invalid_date_raises_error(self, temp_csv_file: Path):
+        """Test that a record the scanner accepts still has its date checked."""
+        content = f"""100,NEM12,200506081149,UNITEDDP,NEMMCO
+200,NEM1201009,E1E2,1,E1,N1,01009,kWh,30,20050610
+{create_300_record("20050230", [0.5])}
+900
+"""
+        create_nem12_file(content, temp_csv_file)
+        
+        parser = NEM12Parser()
+        with pytest.raises(ValueError, match="Line 3: Invalid date format '20050230'"):
+            list(parser.parse(temp_csv_file))
@@ -1,11 +1,11 @@
-"""Tests for the SQLGenerator class."""
+"""Tests for the SQLGenerator and COPYGenerator classes."""
 
 from datetime import datetime
 from decimal import Decimal
 
 import pytest
 
-from nem12 import MeterReading, SQLGenerator
+from nem12 import COPYGenerator, IntervalBatch, MeterReading, SQLGenerator
 
 
 class TestSQLGenerator:
@@ -17,7 +17,7 @@ class TestSQLGenerator:
             MeterReading(
                 nmi="NEM1201009",
                 timestamp=datetime(2005, 3, 1, 0, 30),
-                consumption=Decimal("0.461")
+                consumption=0.461
             )
         ]
         
@@ -36,7 +36,7 @@ class TestSQLGenerator:
             MeterReading(
                 nmi="NEM1201009",
                 timestamp=datetime(2005, 3, 1, i, 0),
-                consumption=Decimal(str(i))
+                consumption=float(i)
             )
             for i in range(5)
         ]
@@ -46,6 +46,7 @@ class TestSQLGenerator:
         
         # 5 readings with batch size 2 = 3 statements (2 + 2 + 1)
         assert len(statements) == 3
+        assert generator.rows_emitted == 5
     
     def test_column_quoting(self):
         """Test that column names are properly quoted."""
@@ -53,7 +54,7 @@ class TestSQLGenerator:
             MeterReading(
                 nmi="TEST",
                 timestamp=datetime(2005, 3, 1, 0, 30),
-                consumption=Decimal("1.0")
+                consumption=1.0
             )
         ]
         
@@ -71,7 +72,7 @@ class TestSQLGenerator:
             MeterReading(
                 nmi="TEST'123",
                 timestamp=datetime(2005, 3, 1, 0, 30),
-                consumption=Decimal("1.0")
+                consumption=1.0
             )
         ]
         
@@ -81,6 +82,19 @@ class TestSQLGenerator:
         # Single quote should be escaped
         assert "TEST''123" in statements[0]
     
+    def test_escaping_follows_nmi_changes(self):
+        """Test that each NMI in a mixed stream is escaped independently."""
+        readings = [
+            MeterReading(nmi=nmi, timestamp=datetime(2005, 3, 1, 0, 30), consumption=1.0)
+            for nmi in ("A'1", "A'1", "B2", "A'1")
+        ]
+        
+        generator = SQLGenerator(batch_size=1)
+        statements = list(generator.generate(readings))
+        
+        assert ["A''1" in s for s in statements] == [True, True, False, True]
+        assert "'B2'" in statements[2]
+    
     def test_invalid_batch_size_raises_error(self):
         """Test that batch size less than 1 raises ValueError."""
         with pytest.raises(ValueError, match="batch_size must be at least 1"):
@@ -97,3 +111,134 @@ class TestSQLGenerator:
         """Test that default batch size is 1000."""
         generator = SQLGenerator()
         assert generator.batch_size == 1000
+    
+    def test_generate_batches_matches_generate(self):
+        """Test that batch formatting produces the same SQL as per-reading formatting."""
+        batches = [
+            IntervalBatch(
+                nmi="TEST'123",
+                interval_date=datetime(2005, 3, 1),
+                interval_minutes=30,
+                intervals=[1, 2, 47, 48],
+                consumptions=[0.461, 0.0, 1.5, 2.0]
+            ),
+            IntervalBatch(
+                nmi="NEM1201009",
+                interval_date=datetime(2005, 12, 31),
+                interval_minutes=15,
+                intervals=[1, 96],
+                consumptions=[3.0, 4.25]
+            ),
+        ]
+        readings = [reading for batch in batches for reading in batch.readings()]
+        
+        generator = SQLGenerator(batch_size=4)
+        
+        assert list(generator.generate_batches(batches)) == list(generator.generate(readings))
+    
+    def test_generate_batches_full_days_across_statements(self):
+        """Test that whole-day templates match per-reading output at any batch size."""
+        batches = [
+            IntervalBatch(
+                nmi=nmi,
+                interval_date=datetime(2005, 3, day),
+                interval_minutes=30,
+                intervals=range(1, 49),
+                consumptions=[i * 0.125 for i in range(48)]
+            )
+            for nmi in ("NEM1201009", "TEST%'1")
+            for day in (1, 2)
+        ]
+        readings = [reading for batch in batches for reading in batch.readings()]
+        
+        for batch_size in (1, 48, 100, 1000):
+            generator = SQLGenerator(batch_size=batch_size)
+            statements = list(generator.generate_batches(batches))
+            
+            assert statements == list(SQLGenerator(batch_size=batch_size).generate(readings))
+            assert generator.rows_emitted == 192
+    
+    def test_negative_zero_renders_as_zero(self):
+        """Test that -0.0 and 0.0 render the same on both formatting paths."""
+        batch = IntervalBatch(
+            nmi="NEM1201009",
+            interval_date=datetime(2005, 3, 1),
+            interval_minutes=30,
+            intervals=[1, 2],
+            consumptions=[-0.0, 0.0]
+        )
+        generator = SQLGenerator()
+        
+        statement = next(generator.generate_batches([batch]))
+        
+        assert "-0.0" not in statement
+        assert statement == next(generator.generate(batch.readings()))
+    
+    def test_non_float_consumptions_render_as_str(self):
+        """Test that Decimal and int consumptions keep their own text form."""
+        readings = [
+            MeterReading("NEM1201009", datetime(2005, 3, 1, 0, 30), 1.5),
+            MeterReading("NEM1201009", datetime(2005, 3, 1, 1, 0), Decimal("0.1")),
+            MeterReading("NEM1201009", datetime(2005, 3, 1, 1, 30), Decimal("1.50")),
+            MeterReading("NEM1201009", datetime(2005, 3, 1, 2, 0), 5),
+        ]
+        
+        # Cache equal float values first so a lookup by value would hit them
+        warm = [MeterReading("NEM1201009", datetime(2005, 3, 1), value) for value in (0.1, 5.0)]
+        list(SQLGenerator().generate(warm))
+        
+        statement = next(SQLGenerator().generate(readings))
+        
+        assert "'2005-03-01 01:00:00', 0.1)" in statement
+        assert "'2005-03-01 01:30:00', 1.50)" in statement
+        assert "'2005-03-01 02:00:00', 5)" in statement
+
+
+class TestCOPYGenerator:
+    """Tests for the COPYGenerator class."""
+    
+    def test_generate_copy_block(self):
+        """Test that readings are rendered as a CSV COPY block."""
+        readings = [
+            MeterReading("NEM1201009", datetime(2005, 3, 1, 0, 30), 0.461),
+            MeterReading("NEM1201009", datetime(2005, 3, 1, 1, 0), 0.81),
+        ]
+        
+        statements = list(COPYGenerator(batch_size=100).generate(readings))
+        
+        assert statements == [
+            'COPY meter_readings ("nmi", "timestamp", "consumption") FROM STDIN WITH (FORMAT csv);\n'
+            "NEM1201009,2005-03-01 00:30:00,0.461\n"
+            "NEM1201009,2005-03-01 01:00:00,0.81\n"
+            "\\."
+        ]
+    
+    def test_nmi_csv_quoting(self):
+        """Test that NMIs with CSV special characters are quoted."""
+        reading = MeterReading('NEM,1"2', datetime(2005, 3, 1, 0, 30), 1.0)
+        
+        statement = next(COPYGenerator().generate([reading]))
+        
+        assert '"NEM,1""2",2005-03-01 00:30:00,1.0\n' in statement
+    
+    def test_generate_batches_matches_generate(self):
+        """Test that batch formatting produces the same COPY blocks as per-reading formatting."""
+        batches = [
+            IntervalBatch(
+                nmi=nmi,
+                interval_date=datetime(2005, 3, 1),
+                interval_minutes=30,
+                intervals=intervals,
+                consumptions=[i * 0.5 for i in range(len(intervals))]
+            )
+            for nmi in ("NEM1201009", "NEM,12%")
+            for intervals in (range(1, 49), [1, 2, 48])
+        ]
+        readings = [reading for batch in batches for reading in batch.readings()]
+        
+        for batch_size in (1, 50, 1000):
+            generator = COPYGenerator(batch_size=batch_size)
+            statements = list(generator.generate_batches(batches))
+            
+            assert statements == list(COPYGenerator(batch_size=batch_size).generate(readings))
+            assert generator.rows_emitted == 102